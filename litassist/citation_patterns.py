@@ -143,6 +143,61 @@ HALLUCINATION_INDICATORS = [
     r"Ex\s+parte\s+[A-Z](?:\s|$)",  # Ex parte with single letters
 ]
 
+# Compiled once at import; validation runs these against every LLM response
+_PLACEHOLDER_RES = [re.compile(pattern) for pattern in PLACEHOLDER_PATTERNS]
+_REPORT_RES = [
+    (re.compile(pattern), series_name, established_year)
+    for pattern, series_name, established_year in REPORT_PATTERNS
+]
+_HALLUCINATION_RES = [re.compile(pattern) for pattern in HALLUCINATION_INDICATORS]
+
+_CITATION_RES = [
+    # Pattern 1: Medium neutral citations [YEAR] COURT NUMBER
+    re.compile(r"\[(\d{4})\]\s+([A-Z][A-Za-z]*+)\s+(\d+)"),
+    # Pattern 2: Traditional citations (YEAR) VOLUME COURT PAGE
+    re.compile(r"\((\d{4})\)\s+(\d+)\s+([A-Z][A-Za-z]*+)\s+(\d+)"),
+    # Pattern 3: Medium neutral with case type suffix [YEAR] COURT Type NUMBER
+    # e.g., [2020] EWCA Civ 1234, [2020] EWHC (QB) 123
+    re.compile(
+        r"\[(\d{4})\]\s+([A-Z][A-Za-z]*+)\s+(?:Civ|Crim|Admin|Fam|QB|Ch|Pat|Comm|TCC)\s+(\d+)"
+    ),
+    # Pattern 4: Citations with volume between year and series
+    # e.g., [2010] 3 NZLR 123, [2019] 2 SLR 123
+    re.compile(r"\[(\d{4})\]\s+(\d+)\s+([A-Z][A-Za-z]*+)\s+(\d+)"),
+    # Pattern 5: US Supreme Court citations
+    # e.g., 123 U.S. 456, 123 US 456
+    re.compile(r"\b(\d+)\s+U\.?S\.?\s+(\d+)\b"),
+    # Pattern 6: US Federal Reporter citations
+    # e.g., 456 F.3d 789, 456 F3d 789
+    re.compile(r"\b(\d+)\s+F\.?\s*[23]d\s+(\d+)\b"),
+    # Pattern 7: US Supreme Court Reporter
+    # e.g., 789 S.Ct. 123, 789 SCt 123
+    re.compile(r"\b(\d+)\s+S\.?\s*Ct\.?\s+(\d+)\b"),
+    # Pattern 8: Lloyd's Reports and Criminal Appeal Reports with possessive
+    # e.g., [2005] 2 Lloyd's Rep 123, (1990) 2 Cr App R 456
+    re.compile(
+        r"(?:\[(\d{4})\]|\((\d{4})\))\s+(\d+)\s+(?:Lloyd's\s*Rep|Cr\s*App\s*R|CrAppR)\s+(\d+)"
+    ),
+]
+# All citation styles as one alternation, so extraction scans the text once
+_CITATION_RE = re.compile("|".join(f"(?:{p.pattern})" for p in _CITATION_RES))
+
+_CASE_NAME_RE = re.compile(
+    r"([A-Z][A-Za-z\'\-]++(?:\s+[A-Z][A-Za-z\'\-]++)*+)\s+v\s+([A-Z][A-Za-z\'\-]++(?:\s+[A-Z][A-Za-z\'\-]++)*+)"
+)
+_MEDIUM_NEUTRAL_RE = re.compile(r"\[(\d{4})\]\s+([A-Z]+)\s+(\d+)")
+_PAGE_RE = re.compile(r"(?:at|,)\s+(\d+)(?:-\d+)?(?:\s|,|\.|\)|$)")
+_PARALLEL_RE = re.compile(
+    r"(\[\d{4}\]\s+[A-Z]+\s+\d+)\s*[;,]\s*(\[\d{4}\]\s+[A-Z]+\s+\d+)"
+)
+_BRACKET_YEAR_RE = re.compile(r"\[(\d{4})\]")
+_TRADITIONAL_CASE_RE = re.compile(
+    r"([A-Za-z\'\-]++(?:\s+[A-Za-z\'\-]++)*)\s+v\s+([A-Za-z\'\-]++(?:\s+[A-Za-z\'\-]++)*)\s+\(\d{4}\)\s+\d+\s+[A-Z]+\s+\d+"
+)
+_MEDIUM_NEUTRAL_CASE_RE = re.compile(
+    r"([A-Za-z\'\-]++(?:\s+[A-Za-z\'\-]++)*)\s+v\s+([A-Za-z\'\-]++(?:\s+[A-Za-z\'\-]++)*)\s+\[\d{4}\]\s+[A-Z]+\s+\d+"
+)
+
 
 # ── Citation Extraction Functions ─────────────────────────────
 
@@ -159,60 +214,23 @@ def extract_citations(text: str) -> List[str]:
         List of unique citations found
     """
     citations = set()
-
-    # Pattern 1: Medium neutral citations [YEAR] COURT NUMBER
-    pattern1 = r"\[(\d{4})\]\s+([A-Z]+[A-Za-z]*)\s+(\d+)"
-    matches1 = re.finditer(pattern1, text)
-    for match in matches1:
-        citations.add(match.group(0))
-
-    # Pattern 2: Traditional citations (YEAR) VOLUME COURT PAGE
-    pattern2 = r"\((\d{4})\)\s+(\d+)\s+([A-Z]+[A-Za-z]*)\s+(\d+)"
-    matches2 = re.finditer(pattern2, text)
-    for match in matches2:
-        citations.add(match.group(0))
-
-    # Pattern 3: Medium neutral with case type suffix [YEAR] COURT Type NUMBER
-    # e.g., [2020] EWCA Civ 1234, [2020] EWHC (QB) 123
-    pattern3 = r"\[(\d{4})\]\s+([A-Z]+[A-Za-z]*)\s+(?:Civ|Crim|Admin|Fam|QB|Ch|Pat|Comm|TCC)\s+(\d+)"
-    matches3 = re.finditer(pattern3, text)
-    for match in matches3:
-        citations.add(match.group(0))
-
-    # Pattern 4: Citations with volume between year and series
-    # e.g., [2010] 3 NZLR 123, [2019] 2 SLR 123
-    pattern4 = r"\[(\d{4})\]\s+(\d+)\s+([A-Z]+[A-Za-z]*)\s+(\d+)"
-    matches4 = re.finditer(pattern4, text)
-    for match in matches4:
-        citations.add(match.group(0))
-
-    # Pattern 5: US Supreme Court citations
-    # e.g., 123 U.S. 456, 123 US 456
-    pattern5 = r"\b(\d+)\s+U\.?S\.?\s+(\d+)\b"
-    matches5 = re.finditer(pattern5, text)
-    for match in matches5:
-        citations.add(match.group(0))
-
-    # Pattern 6: US Federal Reporter citations
-    # e.g., 456 F.3d 789, 456 F3d 789
-    pattern6 = r"\b(\d+)\s+F\.?\s*[23]d\s+(\d+)\b"
-    matches6 = re.finditer(pattern6, text)
-    for match in matches6:
-        citations.add(match.group(0))
-
-    # Pattern 7: US Supreme Court Reporter
-    # e.g., 789 S.Ct. 123, 789 SCt 123
-    pattern7 = r"\b(\d+)\s+S\.?\s*Ct\.?\s+(\d+)\b"
-    matches7 = re.finditer(pattern7, text)
-    for match in matches7:
-        citations.add(match.group(0))
-
-    # Pattern 8: Lloyd's Reports and Criminal Appeal Reports with possessive
-    # e.g., [2005] 2 Lloyd's Rep 123, (1990) 2 Cr App R 456
-    pattern8 = r"(?:\[(\d{4})\]|\((\d{4})\))\s+(\d+)\s+(?:Lloyd's\s*Rep|Cr\s*App\s*R|CrAppR)\s+(\d+)"
-    matches8 = re.finditer(pattern8, text)
-    for match in matches8:
-        citations.add(match.group(0))
+    # End of the last citation taken for each style; like a per-style finditer,
+    # a style never matches again inside its own previous citation
+    style_ends = [0] * len(_CITATION_RES)
+
+    # The combined pattern only finds each position where some style matches;
+    # every style is then tried there, since styles can overlap (e.g.
+    # "(1990) 175 US 175" also holds the US-style "175 US 175")
+    match = _CITATION_RE.search(text)
+    while match:
+        start = match.start()
+        for i, pattern in enumerate(_CITATION_RES):
+            if start >= style_ends[i]:
+                found = pattern.match(text, start)
+                if found:
+                    citations.add(found.group(0))
+                    style_ends[i] = found.end()
+        match = _CITATION_RE.search(text, start + 1)
 
     return list(citations)
 
@@ -234,8 +252,7 @@ def validate_generic_names(content: str, complete_citations: set) -> List[str]:
     issues = []
 
     # Find case patterns and clean up party names
-    case_name_pattern = r"([A-Z][A-Za-z\'\-]+(?:\s+[A-Z][A-Za-z\'\-]+)*)\s+v\s+([A-Z][A-Za-z\'\-]+(?:\s+[A-Z][A-Za-z\'\-]+)*)"
-    raw_case_names = re.findall(case_name_pattern, content)
+    raw_case_names = _CASE_NAME_RE.findall(content)
 
     # Clean up party names by removing common prefixes
     prefix_words = {
@@ -294,8 +311,8 @@ def validate_generic_names(content: str, complete_citations: set) -> List[str]:
             )
 
         # Check for placeholder patterns
-        for pattern in PLACEHOLDER_PATTERNS:
-            if re.match(pattern, p1_lower) or re.match(pattern, p2_lower):
+        for pattern in _PLACEHOLDER_RES:
+            if pattern.match(p1_lower) or pattern.match(p2_lower):
                 issues.append(
                     f"PLACEHOLDER CASE NAME: {party1} v {party2}\n  -> FAILURE: Contains placeholder/test-like party names\n  -> ACTION: Excluding non-real case reference"
                 )
@@ -325,8 +342,7 @@ def validate_court_abbreviations(content: str) -> List[str]:
     issues = []
 
     # Find medium-neutral citations
-    citation_pattern = r"\[(\d{4})\]\s+([A-Z]+)\s+(\d+)"
-    citations = re.findall(citation_pattern, content)
+    citations = _MEDIUM_NEUTRAL_RE.findall(content)
 
     for year_str, court, number_str in citations:
         year = int(year_str)
@@ -379,8 +395,8 @@ def validate_report_series(content: str) -> List[str]:
     """
     issues = []
 
-    for pattern, series_name, established_year in REPORT_PATTERNS:
-        report_citations = re.findall(pattern, content)
+    for pattern, series_name, established_year in _REPORT_RES:
+        report_citations = pattern.findall(content)
         for year_str, volume, series in report_citations:
             year = int(year_str)
             if year < established_year:
@@ -404,8 +420,7 @@ def validate_page_numbers(content: str) -> List[str]:
     issues = []
 
     # Check for impossible page numbers
-    page_pattern = r"(?:at|,)\s+(\d+)(?:-\d+)?(?:\s|,|\.|\)|$)"
-    pages = re.findall(page_pattern, content)
+    pages = _PAGE_RE.findall(content)
     for page_str in pages:
         page = int(page_str)
         if page > 9999:  # Suspiciously high page number
@@ -427,11 +442,10 @@ def validate_parallel_citations(content: str) -> List[str]:
     issues = []
 
     # Check for malformed parallel citations
-    parallel_pattern = r"(\[\d{4}\]\s+[A-Z]+\s+\d+)\s*[;,]\s*(\[\d{4}\]\s+[A-Z]+\s+\d+)"
-    parallel_cites = re.findall(parallel_pattern, content)
+    parallel_cites = _PARALLEL_RE.findall(content)
     for cite1, cite2 in parallel_cites:
-        year1 = re.search(r"\[(\d{4})\]", cite1).group(1)
-        year2 = re.search(r"\[(\d{4})\]", cite2).group(1)
+        year1 = _BRACKET_YEAR_RE.search(cite1).group(1)
+        year2 = _BRACKET_YEAR_RE.search(cite2).group(1)
         if year1 != year2:
             issues.append(
                 f"Parallel citations with different years: {cite1} and {cite2}"
@@ -452,11 +466,9 @@ def detect_hallucination_patterns(content: str) -> List[str]:
     """
     issues = []
 
-    for pattern in HALLUCINATION_INDICATORS:
-        if re.search(pattern, content):
-            matches = re.findall(pattern, content)
-            for match in matches:
-                issues.append(f"Potential AI hallucination pattern: {match.strip()}")
+    for pattern in _HALLUCINATION_RES:
+        for match in pattern.findall(content):
+            issues.append(f"Potential AI hallucination pattern: {match.strip()}")
 
     return issues
 
@@ -474,14 +486,12 @@ def extract_complete_citations(content: str) -> set:
     complete_citations = set()
 
     # Find traditional citations: (Year) Volume Series Page
-    traditional_pattern = r"([A-Za-z\'\-]+(?:\s+[A-Za-z\'\-]+)*)\s+v\s+([A-Za-z\'\-]+(?:\s+[A-Za-z\'\-]+)*)\s+\(\d{4}\)\s+\d+\s+[A-Z]+\s+\d+"
-    traditional_matches = re.findall(traditional_pattern, content)
+    traditional_matches = _TRADITIONAL_CASE_RE.findall(content)
     for party1, party2 in traditional_matches:
         complete_citations.add(f"{party1} v {party2}")
 
     # Find medium-neutral citations: Case Name [Year] Court Number
-    medium_neutral_pattern = r"([A-Za-z\'\-]+(?:\s+[A-Za-z\'\-]+)*)\s+v\s+([A-Za-z\'\-]+(?:\s+[A-Za-z\'\-]+)*)\s+\[\d{4}\]\s+[A-Z]+\s+\d+"
-    medium_neutral_matches = re.findall(medium_neutral_pattern, content)
+    medium_neutral_matches = _MEDIUM_NEUTRAL_CASE_RE.findall(content)
     for party1, party2 in medium_neutral_matches:
         complete_citations.add(f"{party1} v {party2}")
 
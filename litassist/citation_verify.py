@@ -10,7 +10,13 @@ and targeted regeneration when necessary.
 import re
 import time
 import os
-from typing import List, Tuple, Dict
+import contextlib
+import functools
+import logging
+import hashlib
+import shelve
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple, Dict, Optional
 import threading
 
 # Import logging utility and config
@@ -22,6 +28,17 @@ from litassist.citation_patterns import extract_citations
 _citation_cache: Dict[str, Dict] = {}
 _cache_lock = threading.Lock()
 
+# Online verification results also persist across runs so unchanged citations
+# skip the Google CSE round-trip when a document is re-verified.
+CITATION_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".litassist", "cite_cache.db")
+CITATION_CACHE_TTL = 30 * 24 * 60 * 60  # 30 days
+_persistent_cache_enabled = True
+# shelve is not thread-safe; this lock covers only access to an open store
+_persistent_cache_lock = threading.Lock()
+
+# Maximum concurrent online lookups in verify_all_citations
+CITATION_VERIFY_CONCURRENCY = 10
+
 # Australian court abbreviations and their traditional paths (for URL building compatibility)
 COURT_MAPPINGS = {
     "HCA": "cth/HCA",
@@ -173,7 +190,7 @@ def normalize_citation(citation: str) -> str:
         Normalized citation string
     """
     # Remove extra whitespace and normalize
-    citation = re.sub(r"\s+", " ", citation.strip())
+    citation = " ".join(citation.split())
 
     # Handle medium neutral citations
     match = re.match(r"\[(\d{4})\]\s+([A-Z]+[A-Za-z]*)\s+(\d+)", citation)
@@ -410,13 +427,73 @@ def is_traditional_citation_format(citation: str) -> bool:
     return False
 
 
+def set_persistent_cache(enabled: bool) -> None:
+    """Enable or disable the on-disk citation cache for this process."""
+    global _persistent_cache_enabled
+    _persistent_cache_enabled = enabled
+
+
+def _persistent_cache_key(normalized: str) -> str:
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+@contextlib.contextmanager
+def _open_persistent_cache():
+    """
+    Open the on-disk citation cache for one verification run.
+
+    Yields:
+        The open shelve store, or None if the cache is disabled or unavailable
+    """
+    store = None
+    if _persistent_cache_enabled:
+        try:
+            os.makedirs(os.path.dirname(CITATION_CACHE_PATH), exist_ok=True)
+            store = shelve.open(CITATION_CACHE_PATH)
+        except Exception as e:
+            # The cache is best-effort; verification continues with live lookups
+            logging.debug(f"Citation cache unavailable: {e}")
+    try:
+        yield store
+    finally:
+        if store is not None:
+            store.close()
+
+
+def _load_persistent_entry(store, normalized: str) -> Optional[Dict]:
+    """Return an unexpired on-disk cache entry for a normalized citation."""
+    if store is None:
+        return None
+    try:
+        with _persistent_cache_lock:
+            entry = store.get(_persistent_cache_key(normalized))
+    except Exception:
+        return None
+    if entry and time.time() - entry["checked_at"] < CITATION_CACHE_TTL:
+        return entry
+    return None
+
+
+def _store_persistent_entry(store, normalized: str, entry: Dict) -> None:
+    """Record an online verification result in the on-disk cache."""
+    if store is None:
+        return
+    try:
+        with _persistent_cache_lock:
+            store[_persistent_cache_key(normalized)] = entry
+    except Exception as e:
+        # Caching must never break verification
+        logging.debug(f"Could not cache citation result: {e}")
+
+
 @timed
-def verify_single_citation(citation: str) -> Tuple[bool, str, str]:
+def verify_single_citation(citation: str, store=None) -> Tuple[bool, str, str]:
     """
     Verify a single citation against available databases.
 
     Args:
         citation: Citation to verify
+        store: Open on-disk cache from _open_persistent_cache; None skips it
 
     Returns:
         Tuple of (exists, url, reason) where reason explains failure if any
@@ -457,19 +534,27 @@ def verify_single_citation(citation: str) -> Tuple[bool, str, str]:
             }
         return False, "", f"Invalid citation format: {format_issues[0]}"
 
+    stored = _load_persistent_entry(store, normalized)
+    if stored:
+        with _cache_lock:
+            _citation_cache[normalized] = stored
+        return stored["exists"], stored.get("url", ""), stored.get("reason", "")
+
     # Primary verification: Use Jade.io via Google CSE for ALL citations
     try:
         exists_in_jade = search_jade_via_google_cse(normalized, timeout=5)
         if exists_in_jade:
             reason = "Verified via Google CSE search of Jade.io"
+            entry = {
+                "exists": True,
+                "url": "",  # No direct URLs - use Jade.io for access
+                "reason": reason,
+                "checked_at": time.time(),
+            }
 
             with _cache_lock:
-                _citation_cache[normalized] = {
-                    "exists": True,
-                    "url": "",  # No direct URLs - use Jade.io for access
-                    "reason": reason,
-                    "checked_at": time.time(),
-                }
+                _citation_cache[normalized] = entry
+            _store_persistent_entry(store, normalized, entry)
             return True, "", reason
     except Exception:
         pass  # Fall through to offline validation
@@ -505,8 +590,17 @@ def verify_all_citations(text: str) -> Tuple[List[str], List[Tuple[str, str]]]:
     # Enhanced logging to capture full details for audit
     detailed_results = []
 
-    for citation in citations:
-        exists, url, reason = verify_single_citation(citation)
+    # Each lookup is an independent network round-trip; overlap them and
+    # report in extraction order
+    workers = max(1, min(CITATION_VERIFY_CONCURRENCY, len(citations)))
+    with _open_persistent_cache() as store, ThreadPoolExecutor(
+        max_workers=workers
+    ) as pool:
+        results = list(
+            pool.map(functools.partial(verify_single_citation, store=store), citations)
+        )
+
+    for citation, (exists, url, reason) in zip(citations, results):
 
         # Capture full details for logging
         citation_detail = {
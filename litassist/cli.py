@@ -13,6 +13,7 @@ import pinecone
 
 from litassist.config import load_config
 from litassist.commands import register_commands
+from litassist.utils import flush_logs
 
 # Load configuration early so that CONFIG is populated before other modules
 CONFIG = load_config()
@@ -59,6 +60,17 @@ def cli(ctx, log_format, verbose):
     )
 
 
+@cli.result_callback()
+def flush_pending_logs(result, **kwargs):
+    """
+    Finish writing queued JSON logs once a command completes.
+
+    Raises:
+        click.ClickException: If a log could not be saved, so the user sees it.
+    """
+    flush_logs()
+
+
 def validate_credentials(show_progress=True):
     """
     Test API connections with provided credentials.
@@ -11,6 +11,7 @@ import os
 import re
 import logging
 import glob
+import fnmatch
 
 from litassist.config import CONFIG
 from litassist.utils import (
@@ -138,11 +139,15 @@ def regenerate_bad_strategies(
     strategy_results = {}  # Maps original position to final strategy content
     strategies_to_regenerate = []
 
+    # One pass over the whole section first; strategies only need checking one at
+    # a time to attribute issues when that pass finds any
+    section_clean = not client.validate_citations("\n\n".join(strategies))
+
     for i, strategy in enumerate(strategies, 1):
         if not strategy.strip():
             continue
 
-        citation_issues = client.validate_citations(strategy)
+        citation_issues = [] if section_clean else client.validate_citations(strategy)
         if citation_issues:
             click.echo(
                 PROMPTS.get(
@@ -283,17 +288,51 @@ Key principles: [Comprehensive legal principles or precedents with full case cit
         )
 
 
+def _glob_in_listing(pattern: str, listings: dict) -> list:
+    """
+    Expand a glob pattern, listing each literal directory at most once.
+
+    Args:
+        pattern: Glob pattern whose magic characters may appear in the final
+            path component only; other patterns are passed to glob.glob
+        listings: Cache of directory name to entry names, shared across patterns
+
+    Returns:
+        Matching paths, as glob.glob would return them
+    """
+    dirname, basename = os.path.split(pattern)
+    if not basename or any(char in dirname for char in ["*", "?", "["]):
+        return glob.glob(pattern)
+
+    if dirname not in listings:
+        try:
+            with os.scandir(dirname or os.curdir) as entries:
+                listings[dirname] = [entry.name for entry in entries]
+        except OSError:
+            listings[dirname] = []
+
+    # Like glob, wildcards do not match hidden files unless asked to
+    include_hidden = basename.startswith(".")
+    match = re.compile(fnmatch.translate(basename)).match
+    return [
+        os.path.join(dirname, name)
+        for name in listings[dirname]
+        if match(name) and (include_hidden or not name.startswith("."))
+    ]
+
+
 def expand_glob_patterns(ctx, param, value):
     """Expand glob patterns in file paths."""
     if not value:
         return value
 
     expanded_paths = []
+    listings = {}
     for pattern in value:
         # Check if it's a glob pattern (contains *, ?, or [)
         if any(char in pattern for char in ["*", "?", "["]):
             # Expand the glob pattern
-            matches = glob.glob(pattern)
+            matches = _glob_in_listing(pattern, listings)
             if not matches:
                 raise click.BadParameter(f"No files matching pattern: {pattern}")
             expanded_paths.extend(matches)
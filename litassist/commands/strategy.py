@@ -7,8 +7,10 @@ documents for Australian civil litigation matters.
 """
 
 import click
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 import re
+import string
 import time
 
 from litassist.config import CONFIG
@@ -33,6 +35,67 @@ from litassist.utils import (
 from litassist.llm import LLMClientFactory
 from litassist.prompts import PROMPTS
 
+_REQUIRED_HEADINGS = (
+    "Parties",
+    "Background",
+    "Key Events",
+    "Legal Issues",
+    "Evidence Available",
+    "Opposing Arguments",
+    "Procedural History",
+    "Jurisdiction",
+    "Applicable Law",
+    "Client Objectives",
+)
+
+# Headings are matched against lowercased text, which is cheaper than
+# re.IGNORECASE. A heading can have non-alphabetical chars before/after but must
+# be on its own line. Headings are combined into alternations of at most
+# _HEADING_CHUNK_SIZE branches; each finditer pass records which of them are
+# present, keeping the alternations short enough to limit backtracking.
+_HEADING_INDEX = {heading.lower(): i for i, heading in enumerate(_REQUIRED_HEADINGS)}
+_ALL_HEADINGS_SEEN = (1 << len(_REQUIRED_HEADINGS)) - 1
+_HEADING_CHUNK_SIZE = 5
+_HEADING_CHUNK_PATTERNS = tuple(
+    re.compile(
+        r"^\s*[^a-z]*("
+        + "|".join(
+            re.escape(heading.lower())
+            for heading in _REQUIRED_HEADINGS[start : start + _HEADING_CHUNK_SIZE]
+        )
+        + r")[^a-z]*\s*$",
+        re.MULTILINE,
+    )
+    for start in range(0, len(_REQUIRED_HEADINGS), _HEADING_CHUNK_SIZE)
+)
+
+# Characters allowed around a heading line, and bullet markers on issue lines
+_HEADING_STRIP_CHARS = string.punctuation + string.digits + string.whitespace + "•"
+_BULLET_CHARS = "-*•"
+
+# Outcome keywords that select the draft document type
+_APPLICATION_RE = re.compile(
+    r"injunction|order|interim|stay|restraint|interlocutory", re.IGNORECASE
+)
+_AFFIDAVIT_RE = re.compile(r"affidavit|evidence|witness|sworn", re.IGNORECASE)
+
+
+@lru_cache(maxsize=32)
+def _find_missing_headings(text: str) -> Tuple[str, ...]:
+    """Return the required headings absent from text, cached per content."""
+    lowered = text.lower()
+
+    seen = 0
+    for pattern in _HEADING_CHUNK_PATTERNS:
+        for match in pattern.finditer(lowered):
+            seen |= 1 << _HEADING_INDEX[match.group(1)]
+            if seen == _ALL_HEADINGS_SEEN:
+                return ()
+
+    return tuple(
+        heading for i, heading in enumerate(_REQUIRED_HEADINGS) if not seen & (1 << i)
+    )
+
 
 def validate_case_facts_format(text: str) -> bool:
     """
@@ -44,30 +107,7 @@ def validate_case_facts_format(text: str) -> bool:
     Returns:
         True if valid, False if not valid.
     """
-    required_headings = [
-        "Parties",
-        "Background",
-        "Key Events",
-        "Legal Issues",
-        "Evidence Available",
-        "Opposing Arguments",
-        "Procedural History",
-        "Jurisdiction",
-        "Applicable Law",
-        "Client Objectives",
-    ]
-
-    missing_headings = []
-
-    # Check if all required headings exist in the text (less restrictive)
-    for heading in required_headings:
-        # Look for heading with flexible formatting:
-        # - Can have non-alphabetical chars before/after
-        # - Case insensitive
-        # - Must be on its own line (but can have punctuation)
-        pattern = r"^\s*[^a-zA-Z]*" + re.escape(heading) + r"[^a-zA-Z]*\s*$"
-        if not re.search(pattern, text, re.MULTILINE | re.IGNORECASE):
-            missing_headings.append(heading)
+    missing_headings = _find_missing_headings(text)
 
     if missing_headings:
         import click
@@ -79,6 +119,33 @@ def validate_case_facts_format(text: str) -> bool:
     return True
 
 
+@lru_cache(maxsize=32)
+def _extract_legal_issues(case_text: str) -> Tuple[str, ...]:
+    """Return the legal issues in case_text, cached per content."""
+    issues = []
+    in_section = False
+
+    # Scan line by line: the "Legal Issues" section runs until the next
+    # required heading, with one issue per non-blank line
+    for line in case_text.splitlines():
+        stripped = line.strip()
+        heading = stripped.lower().strip(_HEADING_STRIP_CHARS)
+        if heading in _HEADING_INDEX:
+            if in_section:
+                break
+            in_section = heading == "legal issues"
+            continue
+
+        if in_section and stripped:
+            # Strip bullet markers but keep numbering ("1. Breach of contract")
+            if stripped[0] in _BULLET_CHARS:
+                stripped = stripped.lstrip(_BULLET_CHARS).lstrip()
+            if stripped:
+                issues.append(stripped)
+
+    return tuple(issues)
+
+
 def extract_legal_issues(case_text: str) -> List[str]:
     """
     Extract legal issues from the case facts text.
@@ -89,26 +156,24 @@ def extract_legal_issues(case_text: str) -> List[str]:
     Returns:
         List of identified legal issues.
     """
-    # Extract the "Legal Issues" section (less restrictive)
-    # Look for "Legal Issues" with flexible formatting
-    match = re.search(
-        r"[^a-zA-Z]*Legal\s+Issues[^a-zA-Z]*\s*\n(.*?)(?:\n\s*[^a-zA-Z]*(?:Evidence\s+Available|Opposing\s+Arguments)[^a-zA-Z]*)",
-        case_text,
-        re.DOTALL | re.IGNORECASE,
-    )
+    return list(_extract_legal_issues(case_text))
+
 
-    if not match:
-        return []
+def classify_outcome(outcome: str) -> str:
+    """
+    Select the draft document type suited to the desired outcome.
 
-    # Extract individual issues (assuming one per line or bullet point)
-    issues_text = match.group(1).strip()
-    issues = [
-        issue.strip().strip("•-*")
-        for issue in re.split(r"\n+|•|\*|-", issues_text)
-        if issue.strip()
-    ]
+    Args:
+        outcome: The desired outcome sentence.
 
-    return issues
+    Returns:
+        "application", "affidavit" or "claim" (the default).
+    """
+    if _APPLICATION_RE.search(outcome):
+        return "application"
+    if _AFFIDAVIT_RE.search(outcome):
+        return "affidavit"
+    return "claim"
 
 
 @timed
@@ -822,17 +887,7 @@ Focus on:
         raise click.ClickException(f"LLM next steps generation error: {e}")
 
     # Determine appropriate document type based on outcome
-    doc_type = "claim"  # Default
-    if any(
-        term in outcome.lower()
-        for term in ["injunction", "order", "interim", "stay", "restraint"]
-    ):
-        doc_type = "application"
-    elif any(
-        term in outcome.lower()
-        for term in ["affidavit", "evidence", "witness", "sworn"]
-    ):
-        doc_type = "affidavit"
+    doc_type = classify_outcome(outcome)
 
     # Generate draft document
     doc_formats = {
@@ -12,10 +12,12 @@ By default (no flags), all three verifications are performed.
 import os
 import re
 import click
+import functools
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from litassist.prompts import PROMPTS
-from litassist.citation_verify import verify_all_citations
+from litassist.citation_verify import verify_all_citations, set_persistent_cache
 from litassist.citation_patterns import extract_citations
 from litassist.llm import LLMClientFactory
 from litassist.utils import (
@@ -30,6 +32,54 @@ from litassist.utils import (
     LegalReasoningTrace,
 )
 
+# Soundness report parsing: the Issues Found section and its numbered items
+_ISSUES_SECTION_RE = re.compile(
+    r"## Issues Found\s*\n(.*?)(?:\n## |\Z)", re.DOTALL | re.IGNORECASE
+)
+_ISSUE_ITEM_RE = re.compile(r"^[^\S\n]*\d+\.[^\S\n]+(.*)", re.MULTILINE)
+
+# Minimum length of each IRAC section in a complete reasoning trace
+_TRACE_SECTION_MINIMUMS = (
+    ("issue", 10, "Issue statement missing or too brief"),
+    ("applicable_law", 20, "Applicable law section missing or insufficient"),
+    ("application", 30, "Application to facts missing or insufficient"),
+    ("conclusion", 10, "Conclusion missing or too brief"),
+)
+
+
+def _check_citations(content: str) -> tuple:
+    """Verify citations online and count every citation found."""
+    verified, unverified = verify_all_citations(content)
+    return verified, unverified, len(extract_citations(content))
+
+
+def _generate_reasoning(client, content: str) -> str:
+    """Ask the verify model for a new reasoning trace."""
+    enhanced_prompt = create_reasoning_prompt(content, "verify")
+    messages = [
+        {
+            "role": "system",
+            "content": PROMPTS.get("verification.system_prompt"),
+        },
+        {"role": "user", "content": enhanced_prompt},
+    ]
+    response, _ = client.complete(messages, skip_citation_verification=True)
+    return response
+
+
+def _prepare_reasoning(get_client, content: str) -> tuple:
+    """Return the document's own reasoning trace, or generate a new response."""
+    existing_trace = extract_reasoning_trace(content)
+    if existing_trace:
+        return existing_trace, None
+    return None, _generate_reasoning(get_client(), content)
+
+
+def _check_soundness(get_client, content: str) -> tuple:
+    """Run the legal soundness check, returning the result and the model used."""
+    client = get_client()
+    return client.verify(content), client.model
+
 
 def _handle_verification_error(step_name: str, exception: Exception) -> None:
     """Handle verification step errors with consistent formatting and logging."""
@@ -39,12 +89,15 @@ def _handle_verification_error(step_name: str, exception: Exception) -> None:
 
 
 @click.command()
-@click.argument("file", type=click.Path(exists=True))
+@click.argument("file", type=click.Path(exists=True, dir_okay=False))
 @click.option("--citations", is_flag=True, help="Verify citations only")
 @click.option("--soundness", is_flag=True, help="Verify legal soundness only")
 @click.option("--reasoning", is_flag=True, help="Verify/generate reasoning trace only")
+@click.option(
+    "--no-cache", is_flag=True, help="Re-check every citation online, ignoring the on-disk cache"
+)
 @timed
-def verify(file, citations, soundness, reasoning):
+def verify(file, citations, soundness, reasoning, no_cache):
     """
     Verify legal text for citations, soundness, and reasoning.
 
@@ -53,6 +106,8 @@ def verify(file, citations, soundness, reasoning):
     """
     if not any([citations, soundness, reasoning]):
         citations = soundness = reasoning = True
+    if no_cache:
+        set_persistent_cache(False)
 
     click.echo(verifying_message(f"Verifying {file}..."))
 
@@ -70,13 +125,40 @@ def verify(file, citations, soundness, reasoning):
     reports_generated = 0
     extra_files = {}
     reasoning_response = None  # Track reasoning response for potential combination
+    # One client serves both LLM steps; it holds no per-request state. It is
+    # built on first use inside a step, so a factory error is reported as that
+    # step's failure and an existing reasoning trace needs no client at all.
+    @functools.lru_cache(maxsize=1)
+    def get_client():
+        return LLMClientFactory.for_command("verify")
+
+    # The citation lookup overlaps the LLM steps, then each step is reported in
+    # order. Errors surface from result() in each step below. The LLM steps
+    # share one worker because LLMClient.complete swaps the global openai
+    # api_base/api_key and cannot run concurrently with itself.
+    with ThreadPoolExecutor(max_workers=1) as lookup_pool, ThreadPoolExecutor(
+        max_workers=1
+    ) as llm_pool:
+        citation_future = (
+            lookup_pool.submit(_check_citations, content) if citations else None
+        )
+        reasoning_future = (
+            llm_pool.submit(_prepare_reasoning, get_client, content)
+            if reasoning
+            else None
+        )
+        soundness_future = (
+            llm_pool.submit(_check_soundness, get_client, content)
+            if soundness
+            else None
+        )
 
     # 1. Citation Verification
     if citations:
         try:
-            verified, unverified = verify_all_citations(content)
+            verified, unverified, total_found = citation_future.result()
             citation_report = _format_citation_report(
-                verified, unverified, total_found=len(extract_citations(content))
+                verified, unverified, total_found=total_found
             )
             citation_file = os.path.join(
                 os.path.dirname(file) or ".",
@@ -98,7 +180,7 @@ def verify(file, citations, soundness, reasoning):
     # 2. Reasoning Trace Verification/Generation (run BEFORE soundness to allow combination)
     if reasoning:
         try:
-            existing_trace = extract_reasoning_trace(content)
+            existing_trace, response = reasoning_future.result()
             if existing_trace:
                 action = "verified"
                 trace_status = _verify_reasoning_trace(existing_trace)
@@ -123,16 +205,6 @@ def verify(file, citations, soundness, reasoning):
                 report_parts.append(content)
                 reasoning_response = "".join(report_parts)
             else:
-                client = LLMClientFactory.for_command("verify")
-                enhanced_prompt = create_reasoning_prompt(content, "verify")
-                messages = [
-                    {
-                        "role": "system",
-                        "content": PROMPTS.get("verification.system_prompt"),
-                    },
-                    {"role": "user", "content": enhanced_prompt},
-                ]
-                response, _ = client.complete(messages, skip_citation_verification=True)
                 reasoning_response = response  # Store for potential combination with soundness
                 existing_trace = extract_reasoning_trace(response)
                 if not existing_trace:
@@ -171,10 +243,9 @@ def verify(file, citations, soundness, reasoning):
     # 3. Legal Soundness Verification
     if soundness:
         try:
-            client = LLMClientFactory.for_command("verify")
-            soundness_result = client.verify(content)
+            soundness_result, model = soundness_future.result()
             issues = _parse_soundness_issues(soundness_result)
-            soundness_report = _format_soundness_report(issues, soundness_result, client.model, reasoning_response)
+            soundness_report = _format_soundness_report(issues, soundness_result, model, reasoning_response)
             soundness_file = os.path.join(
                 os.path.dirname(file) or ".",
                 f"verify_{os.path.basename(base_name)}_soundness.txt",
@@ -245,21 +316,13 @@ def _format_citation_report(verified: list, unverified: list, total_found: int)
 
 def _parse_soundness_issues(soundness_result: str) -> list:
     """Parse legal soundness issues from the '## Issues Found' section."""
-    issues = []
-    match = re.search(
-        r"## Issues Found\s*\n(.*?)(?:\n## |\Z)",
-        soundness_result,
-        re.DOTALL | re.IGNORECASE,
-    )
-    if match:
-        block = match.group(1).strip()
-        if "no issues found" in block.lower():
-            return []
-        for line in block.splitlines():
-            m = re.match(r"\s*\d+\.\s+(.*)", line)
-            if m:
-                issues.append(m.group(1).strip())
-    return issues
+    match = _ISSUES_SECTION_RE.search(soundness_result)
+    if not match:
+        return []
+    block = match.group(1).strip()
+    if "no issues found" in block.lower():
+        return []
+    return [m.group(1).strip() for m in _ISSUE_ITEM_RE.finditer(block)]
 
 
 def _format_soundness_report(issues: list, full_response: str, model: str, reasoning_response: str = None) -> str:
@@ -292,19 +355,13 @@ def _format_soundness_report(issues: list, full_response: str, model: str, reaso
 
 def _verify_reasoning_trace(trace: LegalReasoningTrace) -> dict:
     """Verify completeness and quality of existing reasoning trace."""
-    status = {"complete": True, "issues": []}
-    if not trace.issue or len(trace.issue) < 10:
-        status["complete"] = False
-        status["issues"].append("Issue statement missing or too brief")
-    if not trace.applicable_law or len(trace.applicable_law) < 20:
-        status["complete"] = False
-        status["issues"].append("Applicable law section missing or insufficient")
-    if not trace.application or len(trace.application) < 30:
-        status["complete"] = False
-        status["issues"].append("Application to facts missing or insufficient")
-    if not trace.conclusion or len(trace.conclusion) < 10:
-        status["complete"] = False
-        status["issues"].append("Conclusion missing or too brief")
+    issues = [
+        message
+        for field, minimum, message in _TRACE_SECTION_MINIMUMS
+        if len(getattr(trace, field) or "") < minimum
+    ]
+    # Only missing IRAC sections make a trace incomplete
+    status = {"complete": not issues, "issues": issues}
     if trace.confidence < 0 or trace.confidence > 100:
         status["issues"].append(f"Invalid confidence score: {trace.confidence}")
     if not trace.sources:
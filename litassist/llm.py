@@ -90,6 +90,7 @@ PARAMETER_PROFILES = {
             "metadata",
             "stop_sequences",
         ],
+        "prompt_caching": True,  # Static system prompts are cached via cache_control
     },
     "google": {
         "allowed": [
@@ -248,6 +249,58 @@ def supports_system_messages(model_name: str) -> bool:
     return profile.get("system_message_support", True)  # Default to True
 
 
+# High-risk content that triggers auto-verification, as one alternation
+_RISK_CONTENT_RE = re.compile(
+    "|".join(
+        [
+            r"\[\d{4}\]\s+\w+\s+\d+",  # Case citations
+            r"\d+%",  # Percentage claims
+            r'"must"|"cannot"|"will"',  # Strong legal conclusions
+            r"section\s+\d+",  # Statutory references
+            r"rule\s+\d+",  # Court rules
+            r"paragraph\s+\d+",  # Paragraph references
+        ]
+    ),
+    re.IGNORECASE,
+)
+
+
+def supports_prompt_caching(model_name: str) -> bool:
+    """
+    Check if a model accepts cache_control breakpoints on message content.
+
+    Args:
+        model_name: The full model name
+
+    Returns:
+        True if system prompts should be marked for provider-side caching
+    """
+    model_family = get_model_family(model_name)
+    profile = PARAMETER_PROFILES.get(model_family, PARAMETER_PROFILES["default"])
+    return profile.get("prompt_caching", False)
+
+
+def _with_cached_system_prompts(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Mark plain-text system messages as ephemeral cache breakpoints."""
+    return [
+        (
+            {
+                **msg,
+                "content": [
+                    {
+                        "type": "text",
+                        "text": msg["content"],
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ],
+            }
+            if msg.get("role") == "system" and isinstance(msg.get("content"), str)
+            else msg
+        )
+        for msg in messages
+    ]
+
+
 class LLMClientFactory:
     """
     Factory class for creating LLMClient instances with command-specific configurations.
@@ -498,6 +551,9 @@ class LLMClient:
         ```
     """
 
+    # _force_verify is set by LLMClientFactory and left unset otherwise
+    __slots__ = ("_force_verify", "command_context", "default_params", "model")
+
     def __init__(self, model: str, **default_params):
         """
         Initialize an LLM client for chat completions.
@@ -705,7 +761,9 @@ class LLMClient:
             # Regular models - handle system messages normally
             # Note: Commands already include base.australian_law in their system prompts,
             # so we don't need to append it here. This prevents prompt corruption.
-            pass
+            if supports_prompt_caching(self.model):
+                # System prompts are static per command; let the provider cache them
+                messages = _with_cached_system_prompts(messages)
 
         # Merge default and override parameters
         params = {**self.default_params, **overrides}
@@ -1241,20 +1299,7 @@ class LLMClient:
             return True
 
         # Auto-verify when output contains high-risk content
-        risk_patterns = [
-            r"\[\d{4}\]\s+\w+\s+\d+",  # Case citations
-            r"\d+%",  # Percentage claims
-            r'"must"|"cannot"|"will"',  # Strong legal conclusions
-            r"section\s+\d+",  # Statutory references
-            r"rule\s+\d+",  # Court rules
-            r"paragraph\s+\d+",  # Paragraph references
-        ]
-
-        for pattern in risk_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
-                return True
-
-        return False
+        return _RISK_CONTENT_RE.search(content) is not None
 
     def validate_citations(self, content: str, enable_online: bool = True) -> List[str]:
         """
@@ -7,19 +7,33 @@ including timing, logging, document processing, embedding generation, and legal
 
 import os
 import time
+import asyncio
+import atexit
 import json
 import logging
+import mmap
+import stat
 import threading
 import functools
+import hashlib
+import itertools
+import queue
 import re
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import List, Any, Callable, Dict, Optional
 
 import click
 import openai
-from pypdf import PdfReader
+from openai.openai_object import OpenAIObject
 
 from litassist.prompts import PROMPTS
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # ── Terminal Colors ─────────────────────────────────────────
 class Colors:
@@ -190,6 +204,99 @@ def _sanitize_for_json(obj):
         return obj
 
 
+# Write buffer for JSON log files
+LOG_WRITE_BUFFER_SIZE = 65536
+
+
+class _LogWriter:
+    """Background writer that takes JSON log file I/O off the calling thread."""
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._errors = []
+
+    def submit(self, path: str, payload: Any):
+        """Queue a payload to be written as JSON to path."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="litassist-log-writer", daemon=True
+                )
+                self._thread.start()
+                atexit.register(self._flush_at_exit)
+        self._queue.put((path, payload))
+
+    def _run(self):
+        while True:
+            path, payload = self._queue.get()
+            try:
+                # default=str covers anything _sanitize_for_json passed through
+                if orjson is not None:
+                    data = orjson.dumps(
+                        payload,
+                        default=str,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                    )
+                    with open(path, "wb", buffering=LOG_WRITE_BUFFER_SIZE) as f:
+                        f.write(data)
+                else:
+                    with open(
+                        path, "w", encoding="utf-8", buffering=LOG_WRITE_BUFFER_SIZE
+                    ) as f:
+                        json.dump(
+                            payload, f, ensure_ascii=False, indent=2, default=str
+                        )
+                logging.debug(f"JSON log saved: {path}")
+            except Exception as e:
+                with self._lock:
+                    self._errors.append((path, e))
+            finally:
+                self._queue.task_done()
+
+    def flush(self):
+        """
+        Wait for queued logs to be written.
+
+        Raises:
+            click.ClickException: If a queued log could not be written.
+        """
+        self._queue.join()
+        with self._lock:
+            errors, self._errors = self._errors, []
+        if errors:
+            path, e = errors[0]
+            if isinstance(e, IOError):
+                raise click.ClickException(
+                    PROMPTS.get(
+                        "system_feedback.errors.file.save_json_failed",
+                        path=path,
+                        error=str(e),
+                    )
+                )
+            raise e
+
+    def _flush_at_exit(self):
+        try:
+            self.flush()
+        except Exception as e:
+            logging.warning(f"Failed to save log: {e}")
+
+
+_log_writer = _LogWriter()
+
+
+def flush_logs():
+    """
+    Block until all queued JSON logs have been written.
+
+    Raises:
+        click.ClickException: If a queued log could not be written.
+    """
+    _log_writer.flush()
+
+
 @timed
 def save_log(tag: str, payload: dict):
     """
@@ -201,12 +308,15 @@ def save_log(tag: str, payload: dict):
     - Command output logs
     - Generic/unknown log types
 
+    JSON logs are written by a background thread; call flush_logs() to wait for
+    pending writes.
+
     Args:
         tag: A string identifier for the log (e.g., command name).
         payload: Dictionary containing log data including inputs, response, and usage statistics.
 
     Raises:
-        click.ClickException: If there's an error writing the log file.
+        click.ClickException: If there's an error writing a Markdown log file.
     """
     from click import get_current_context
     from litassist.config import CONFIG
@@ -224,20 +334,10 @@ def save_log(tag: str, payload: dict):
     # JSON logging
     if log_format == "json":
         path = os.path.join(LOG_DIR, f"{tag}_{ts}.json")
-        try:
-            # Sanitize payload for JSON serialization (handle Mock objects)
-            sanitized_payload = _sanitize_for_json(payload)
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(sanitized_payload, f, ensure_ascii=False, indent=2)
-            logging.debug(f"JSON log saved: {path}")
-        except IOError as e:
-            raise click.ClickException(
-                PROMPTS.get(
-                    "system_feedback.errors.file.save_json_failed",
-                    path=path,
-                    error=str(e),
-                )
-            )
+        # Sanitize payload for JSON serialization (handle Mock objects); this also
+        # snapshots the payload so the caller may keep mutating it
+        sanitized_payload = _sanitize_for_json(payload)
+        _log_writer.submit(path, sanitized_payload)
         return
 
     # Markdown logging with intelligent template selection
@@ -468,6 +568,37 @@ def _write_generic_markdown(f, tag: str, ts: str, payload: dict):
         f.write("\n")
 
 
+def _read_text_file(path: str) -> str:
+    """
+    Read a UTF-8 text file through a memory map, decoding in one pass.
+
+    Line endings are normalized as in a text-mode read.
+    """
+    with open(path, "rb") as f:
+        st = os.fstat(f.fileno())
+        if stat.S_ISREG(st.st_mode) and st.st_size > 0:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                content = str(mm, "utf-8")
+        else:
+            # Empty files cannot be mapped; pipes and /proc files report size 0
+            content = f.read().decode("utf-8")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+# Minimum pages per worker process when extracting text from large PDFs
+PDF_PAGES_PER_WORKER = 25
+
+
+def _extract_pdf_pages(path: str, start: int, stop: int) -> List[str]:
+    """Extract the text of pages [start, stop) of a PDF in a worker process."""
+    from pypdf import PdfReader
+
+    reader = PdfReader(path)
+    return [reader.pages[i].extract_text() for i in range(start, stop)]
+
+
 @timed
 def read_document(path: str) -> str:
     """
@@ -484,18 +615,31 @@ def read_document(path: str) -> str:
     """
     try:
         if path.lower().endswith(".pdf"):
+            # pypdf is slow to import and only needed for PDF input
+            from pypdf import PdfReader
+
             reader = PdfReader(path)
-            pages = []
-            for page in reader.pages:
-                txt = page.extract_text()
-                if txt:
-                    pages.append(txt)
+            page_count = len(reader.pages)
+            workers = min(os.cpu_count() or 1, page_count // PDF_PAGES_PER_WORKER)
+            if workers > 1:
+                # Extraction is CPU-bound; give each process a contiguous page range
+                step = -(-page_count // workers)
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    futures = [
+                        pool.submit(
+                            _extract_pdf_pages, path, start, min(start + step, page_count)
+                        )
+                        for start in range(0, page_count, step)
+                    ]
+                    texts = [txt for future in futures for txt in future.result()]
+            else:
+                texts = [page.extract_text() for page in reader.pages]
+            pages = [txt for txt in texts if txt]
             if not pages:
                 raise click.ClickException(f"No extractable text found in PDF: {path}")
             return "\n".join(pages)
         else:
-            with open(path, "r", encoding="utf-8") as f:
-                content = f.read()
+            content = _read_text_file(path)
             if not content.strip():
                 raise click.ClickException(f"No text found in file: {path}")
             return content
@@ -505,6 +649,95 @@ def read_document(path: str) -> str:
         raise click.ClickException(f"Error reading document {path}: {e}")
 
 
+# Embedding request limits
+EMBEDDING_BATCH_SIZE = 100
+EMBEDDING_BATCH_MAX_TOKENS = 250000
+# Maximum embedding requests in flight at once
+EMBEDDING_MAX_CONCURRENCY = 5
+
+# Embedding vectors cached by model and content hash so repeated chunks skip
+# the API; the least recently used are evicted beyond EMBEDDING_CACHE_SIZE
+EMBEDDING_CACHE_SIZE = 4096
+_embedding_cache: "OrderedDict[str, tuple]" = OrderedDict()
+_embedding_cache_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_encoding():
+    """
+    Load the cl100k_base tokenizer once per process.
+
+    Returns:
+        The tiktoken encoding, or None if tiktoken is missing or its vocabulary
+        cannot be loaded (the failure is cached so it is not retried per call).
+    """
+    try:
+        import tiktoken
+
+        # cl100k_base is used by GPT-4, Claude, most modern models
+        return tiktoken.get_encoding("cl100k_base")
+    except ImportError:
+        return None
+    except Exception as e:
+        logging.warning(
+            f"tiktoken encoding unavailable: {e}. Falling back to token estimation."
+        )
+        return None
+
+
+def _validate_embedding_inputs(texts: List[str]) -> None:
+    """
+    Reject any text that exceeds the embedding model's token limit.
+
+    Raises:
+        ValueError: If any text exceeds the model's token limit.
+    """
+    # Validate text lengths (8191 tokens ≈ 32000 chars for safety)
+    MAX_CHARS = 32000
+    for i, text in enumerate(texts):
+        if len(text) > MAX_CHARS:
+            raise ValueError(
+                f"Text at index {i} is too long ({len(text)} chars). "
+                f"Maximum is approximately {MAX_CHARS} characters. "
+                f"Use smaller chunks with chunk_text(text, max_chars=8000)."
+            )
+
+
+def _embedding_batches(texts: List[str]) -> List[List[str]]:
+    """
+    Split texts into batches for the embeddings endpoint, preserving order.
+
+    Args:
+        texts: List of text strings to embed.
+
+    Returns:
+        List of batches, each within EMBEDDING_BATCH_SIZE inputs and
+        EMBEDDING_BATCH_MAX_TOKENS tokens (estimated at ~4 chars per token
+        when tiktoken is unavailable).
+    """
+    encoding = _get_encoding()
+    batches = []
+    batch = []
+    batch_tokens = 0
+    for text in texts:
+        if encoding is not None:
+            tokens = len(encoding.encode(text))
+        else:
+            tokens = len(text) // 4 + 1
+        if batch and (
+            len(batch) >= EMBEDDING_BATCH_SIZE
+            or batch_tokens + tokens > EMBEDDING_BATCH_MAX_TOKENS
+        ):
+            batches.append(batch)
+            batch = []
+            batch_tokens = 0
+        batch.append(text)
+        batch_tokens += tokens
+    if batch:
+        batches.append(batch)
+    return batches
+
+
 @timed
 def create_embeddings(texts: List[str]) -> List[Any]:
     """
@@ -514,7 +747,11 @@ def create_embeddings(texts: List[str]) -> List[Any]:
         texts: List of text strings to embed.
 
     Returns:
-        The embedding data from the OpenAI API response.
+        One embedding object per input, in input order, each with ``embedding``
+        and ``index`` set for this request. Inputs are sent in batches rather
+        than one request per text, up to EMBEDDING_MAX_CONCURRENCY batches at
+        a time, and texts already embedded with the same model are served
+        from a bounded LRU cache.
 
     Raises:
         Exception: If the embedding API call fails.
@@ -523,52 +760,187 @@ def create_embeddings(texts: List[str]) -> List[Any]:
     # Import here to avoid circular imports
     from litassist.config import CONFIG
 
-    # Validate text lengths (8191 tokens ≈ 32000 chars for safety)
-    MAX_CHARS = 32000
-    for i, text in enumerate(texts):
-        if len(text) > MAX_CHARS:
-            raise ValueError(
-                f"Text at index {i} is too long ({len(text)} chars). "
-                f"Maximum is approximately {MAX_CHARS} characters. "
-                f"Use smaller chunks with chunk_text(text, max_chars=8000)."
-            )
+    _validate_embedding_inputs(texts)
+
+    model = CONFIG.emb_model
+    keys, vectors, misses = _lookup_embeddings(texts, model)
+
+    # Pack inputs into as few requests as possible; each batch stays under both
+    # the per-request input count and a conservative token budget
+    if misses:
+        batches = _embedding_batches(list(misses.values()))
+
+        def embed_batch(batch):
+            # Use the model without custom dimensions since our index is 1536-dimensional
+            return openai.Embedding.create(input=batch, model=model).data
+
+        # Each batch is an independent round-trip; map keeps batch order
+        workers = min(EMBEDDING_MAX_CONCURRENCY, len(batches))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(embed_batch, batches))
+        _store_embeddings(
+            vectors, misses, [item for batch_data in results for item in batch_data]
+        )
 
-    # Use the model without custom dimensions since our index is 1536-dimensional
-    return openai.Embedding.create(input=texts, model=CONFIG.emb_model).data
+    return _embedding_results(keys, vectors)
+
+
+def _embedding_cache_key(text: str, model: Any) -> str:
+    """Build the embedding cache key from the model name and a content hash."""
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+    return f"{model}:{digest}"
+
+
+def _lookup_embeddings(texts: List[str], model: Any) -> tuple:
+    """
+    Look texts up in the embedding cache.
+
+    Returns:
+        Tuple of (cache key per text, cached vectors by key, distinct uncached
+        texts by key in first-occurrence order)
+    """
+    keys = [_embedding_cache_key(text, model) for text in texts]
+    vectors = {}
+    misses = {}
+    with _embedding_cache_lock:
+        for key, text in zip(keys, texts):
+            if key in vectors or key in misses:
+                continue
+            vector = _embedding_cache.get(key)
+            if vector is None:
+                misses[key] = text
+            else:
+                _embedding_cache.move_to_end(key)
+                vectors[key] = vector
+    return keys, vectors, misses
+
+
+def _store_embeddings(vectors: Dict[str, tuple], misses: Dict[str, str], data) -> None:
+    """Add fetched embeddings to vectors and the cache, evicting the oldest."""
+    for key, item in zip(misses, data):
+        vectors[key] = tuple(item.embedding)
+    with _embedding_cache_lock:
+        for key in misses:
+            _embedding_cache[key] = vectors[key]
+            _embedding_cache.move_to_end(key)
+        while len(_embedding_cache) > EMBEDDING_CACHE_SIZE:
+            _embedding_cache.popitem(last=False)
+
+
+def _embedding_results(keys: List[str], vectors: Dict[str, tuple]) -> List[Any]:
+    """Build fresh embedding objects for this request, indexed by input position."""
+    return [
+        OpenAIObject.construct_from(
+            {"object": "embedding", "index": i, "embedding": list(vectors[key])}
+        )
+        for i, key in enumerate(keys)
+    ]
+
+
+def clear_embedding_cache():
+    """Clear the embedding cache."""
+    with _embedding_cache_lock:
+        _embedding_cache.clear()
+
+
+async def acreate_embeddings(
+    texts: List[str], max_concurrency: int = EMBEDDING_MAX_CONCURRENCY
+) -> List[Any]:
+    """
+    Create embeddings concurrently, dispatching batches in parallel.
+
+    Args:
+        texts: List of text strings to embed.
+        max_concurrency: Maximum number of embedding requests in flight.
+
+    Returns:
+        One embedding object per input, in input order, as for
+        create_embeddings (sharing its cache).
+
+    Raises:
+        Exception: If any embedding API call fails.
+        ValueError: If any text exceeds the model's token limit.
+    """
+    # Import here to avoid circular imports
+    from litassist.config import CONFIG
+
+    _validate_embedding_inputs(texts)
+
+    model = CONFIG.emb_model
+    keys, vectors, misses = _lookup_embeddings(texts, model)
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def embed_batch(batch):
+        async with semaphore:
+            response = await openai.Embedding.acreate(input=batch, model=model)
+            return response.data
+
+    if misses:
+        # gather returns results in batch order regardless of completion order
+        results = await asyncio.gather(
+            *(embed_batch(batch) for batch in _embedding_batches(list(misses.values())))
+        )
+        _store_embeddings(
+            vectors, misses, [item for batch_data in results for item in batch_data]
+        )
+
+    return _embedding_results(keys, vectors)
+
+
+# Token counts for large texts are extrapolated from evenly spaced windows
+TOKEN_SAMPLE_WINDOWS = 16
+TOKEN_SAMPLE_WINDOW_CHARS = 4096
+
+
+def _sampled_token_count(encoding, text: str) -> int:
+    """
+    Count tokens exactly, or estimate them from samples for large texts.
+
+    Texts over twice the sample size are estimated from TOKEN_SAMPLE_WINDOWS
+    contiguous windows spread across the text, scaled by total length.
+    """
+    sample_chars = TOKEN_SAMPLE_WINDOWS * TOKEN_SAMPLE_WINDOW_CHARS
+    if len(text) <= sample_chars * 2:
+        return len(encoding.encode(text))
+
+    step = len(text) // TOKEN_SAMPLE_WINDOWS
+    sampled_tokens = sum(
+        len(encoding.encode(text[start : start + TOKEN_SAMPLE_WINDOW_CHARS]))
+        for start in range(0, step * TOKEN_SAMPLE_WINDOWS, step)
+    )
+    return round(sampled_tokens * len(text) / sample_chars)
 
 
 def count_tokens_and_words(text: str) -> tuple[int, int]:
     """
     Count both tokens and words in text content.
 
+    Token counts for texts over 128K characters are sampled estimates, which
+    is accurate enough for the size warnings this feeds.
+
     Args:
         text: The text content to analyze
 
     Returns:
         Tuple of (token_count, word_count)
     """
-    # Try to import tiktoken if available
-    try:
-        import tiktoken
-        TIKTOKEN_AVAILABLE = True
-    except ImportError:
-        TIKTOKEN_AVAILABLE = False
-        
-    if TIKTOKEN_AVAILABLE:
+    # Split once; the word count also drives the fallback token estimate
+    word_count = len(text.split())
+
+    encoding = _get_encoding()
+    if encoding is not None:
         try:
-            # Use cl100k_base encoding (used by GPT-4, Claude, most modern models)
-            encoding = tiktoken.get_encoding("cl100k_base")
-            token_count = len(encoding.encode(text))
+            token_count = _sampled_token_count(encoding, text)
         except Exception as e:
             # Log warning and fall back to estimation
             logging.warning(f"tiktoken token counting failed: {e}. Falling back to word count estimation.")
             # Fallback: rough estimation (1 token ≈ 0.75 words)
-            token_count = int(len(text.split()) * 1.33)
+            token_count = int(word_count * 1.33)
     else:
         # Fallback: rough estimation (1 token ≈ 0.75 words)
-        token_count = int(len(text.split()) * 1.33)
+        token_count = int(word_count * 1.33)
 
-    word_count = len(text.split())
     return token_count, word_count
 
 
@@ -607,7 +979,7 @@ def chunk_text(text: str, max_chars: int = 20000) -> List[str]:
 
     try:
         # Normalize whitespace first (OCR often has inconsistent spacing)
-        normalized_text = re.sub(r"\s+", " ", text.strip())
+        normalized_text = " ".join(text.split())
 
         chunks = []
         current_chunk = ""
@@ -680,6 +1052,20 @@ def chunk_text(text: str, max_chars: int = 20000) -> List[str]:
         raise ValueError(f"Error during text chunking: {e}")
 
 
+# Sentence endings common in OCR text, combined so the text is split in one pass
+_SENTENCE_BOUNDARY_RE = re.compile(
+    "|".join(
+        [
+            r"(?<=[.!?])\s+(?=[A-Z])",  # Standard: punctuation + space + capital
+            r"(?<=[.!?])\s*\n+\s*(?=[A-Z])",  # punctuation + newline(s) + capital
+            r"(?<=[.!?])\s*(?=\d+\.)",  # punctuation + numbered list
+            r"(?<=\.)\s*(?=[A-Z][a-z])",  # period + capital + lowercase (common in OCR)
+            r"(?<=[.!?])\s*(?=[A-Z][A-Z])",  # punctuation + all caps (headers)
+        ]
+    )
+)
+
+
 def _split_into_sentences(text: str) -> List[str]:
     """
     Enhanced sentence splitting that handles OCR artifacts.
@@ -690,25 +1076,8 @@ def _split_into_sentences(text: str) -> List[str]:
     Returns:
         List of sentences.
     """
-    # Multiple patterns to catch different sentence endings common in OCR text
-    patterns = [
-        r"(?<=[.!?])\s+(?=[A-Z])",  # Standard: punctuation + space + capital
-        r"(?<=[.!?])\s*\n+\s*(?=[A-Z])",  # punctuation + newline(s) + capital
-        r"(?<=[.!?])\s*(?=\d+\.)",  # punctuation + numbered list
-        r"(?<=\.)\s*(?=[A-Z][a-z])",  # period + capital + lowercase (common in OCR)
-        r"(?<=[.!?])\s*(?=[A-Z][A-Z])",  # punctuation + all caps (headers)
-    ]
-
-    sentences = [text]
-
-    for pattern in patterns:
-        new_sentences = []
-        for sentence in sentences:
-            split_parts = re.split(pattern, sentence)
-            new_sentences.extend(split_parts)
-        sentences = [s.strip() for s in new_sentences if s.strip()]
-
-    return sentences
+    parts = _SENTENCE_BOUNDARY_RE.split(text)
+    return [s.strip() for s in parts if s.strip()]
 
 
 def heartbeat(interval: int = 30):
@@ -731,28 +1100,69 @@ def heartbeat(interval: int = 30):
     def decorator(fn):
         @functools.wraps(fn)
         def wrapper(*args, **kwargs):
-            done = threading.Event()
-
-            def ping():
-                while not done.is_set():
-                    # Suppress during pytest runs
-                    if not os.environ.get("PYTEST_CURRENT_TEST"):
-                        click.echo("…still working, please wait…", err=True)
-                    time.sleep(interval)
-
-            t = threading.Thread(target=ping, daemon=True)
-            t.start()
+            task_id = _heartbeat_daemon.add(interval)
             try:
                 return fn(*args, **kwargs)
             finally:
-                done.set()
-                t.join(timeout=0)
+                _heartbeat_daemon.remove(task_id)
 
         return wrapper
 
     return decorator
 
 
+class _HeartbeatDaemon:
+    """Single background thread that emits heartbeats for all active calls."""
+
+    def __init__(self):
+        self._wakeup = threading.Condition()
+        self._ids = itertools.count()
+        self._thread = None
+        # task_id -> [interval, next_due] on the time.monotonic() clock
+        self.active: Dict[int, list] = {}
+
+    def add(self, interval: float) -> int:
+        """Register a running call; the daemon thread is started on first use."""
+        with self._wakeup:
+            task_id = next(self._ids)
+            self.active[task_id] = [interval, time.monotonic() + interval]
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="litassist-heartbeat", daemon=True
+                )
+                self._thread.start()
+            self._wakeup.notify()
+        return task_id
+
+    def remove(self, task_id: int):
+        """Unregister a finished call."""
+        with self._wakeup:
+            self.active.pop(task_id, None)
+
+    def _run(self):
+        while True:
+            with self._wakeup:
+                now = time.monotonic()
+                due = False
+                for task in self.active.values():
+                    if task[1] <= now:
+                        task[1] = now + task[0]
+                        due = True
+                if not due:
+                    # Sleep until the earliest heartbeat or until a call is added
+                    next_due = min(
+                        (task[1] for task in self.active.values()), default=None
+                    )
+                    self._wakeup.wait(None if next_due is None else next_due - now)
+                    continue
+            # One message per tick however many calls are due; suppress under pytest
+            if not os.environ.get("PYTEST_CURRENT_TEST"):
+                click.echo("…still working, please wait…", err=True)
+
+
+_heartbeat_daemon = _HeartbeatDaemon()
+
+
 # ── Legal Reasoning Traces ─────────────────────────────────────
 
 
@@ -764,6 +1174,17 @@ class LegalReasoningTrace:
     behind conclusions in a standardized format.
     """
 
+    __slots__ = (
+        "applicable_law",
+        "application",
+        "command",
+        "conclusion",
+        "confidence",
+        "issue",
+        "sources",
+        "timestamp",
+    )
+
     def __init__(
         self,
         issue: str,
@@ -881,6 +1302,36 @@ Each section should appear exactly once. Do not repeat sections or content. This
     return base_prompt + reasoning_instruction
 
 
+# The trace runs from its header to the end of the content or another major
+# header. It is non-greedy.
+_REASONING_TRACE_RE = re.compile(
+    r"=== REASONING ===\s*\n(.*?)(?=\n===|$)", re.DOTALL | re.IGNORECASE
+)
+_REASONING_COMPONENT_RES = {
+    key: re.compile(pattern, re.DOTALL | re.IGNORECASE)
+    for key, pattern in {
+        "issue": r"Issue:\s*(.*?)(?=\n\s*Applicable Law:|\n\s*Application to Facts:|\n\s*Conclusion:|\n\s*Confidence:|\n\s*Sources:|\Z)",
+        "applicable_law": r"Applicable Law:\s*(.*?)(?=\n\s*Application to Facts:|\n\s*Conclusion:|\n\s*Confidence:|\n\s*Sources:|\Z)",
+        "application": r"Application to Facts:\s*(.*?)(?=\n\s*Conclusion:|\n\s*Confidence:|\n\s*Sources:|\Z)",
+        "conclusion": r"Conclusion:\s*(.*?)(?=\n\s*Confidence:|\n\s*Sources:|\Z)",
+        "confidence": r"Confidence:\s*(\d+)",
+        "sources": r"Sources:\s*(.*?)(?=\n\s*Generated:|\Z)",
+    }.items()
+}
+
+# A trace in the canonical order the prompt asks for is read in one pass; any
+# other layout falls back to the per-component patterns above.
+_REASONING_FIELDS_RE = re.compile(
+    r"Issue:\s*+(?P<issue>.*?)"
+    r"\n\s*Applicable Law:\s*+(?P<applicable_law>.*?)"
+    r"\n\s*Application to Facts:\s*+(?P<application>.*?)"
+    r"\n\s*Conclusion:\s*+(?P<conclusion>.*?)"
+    r"\n\s*Confidence:\s*+(?P<confidence>\d+)[^\n]*"
+    r"\n\s*Sources:\s*+(?P<sources>.*?)(?=\n\s*Generated:|\Z)",
+    re.DOTALL | re.IGNORECASE,
+)
+
+
 def extract_reasoning_trace(
     content: str, command: str = None
 ) -> Optional[LegalReasoningTrace]:
@@ -894,37 +1345,33 @@ def extract_reasoning_trace(
     Returns:
         LegalReasoningTrace object if found, None otherwise
     """
-    # The pattern now looks for the start of the trace and captures everything
-    # until the end of the content or another major header. It is non-greedy.
-    trace_pattern = r"=== REASONING ===\s*\n(.*?)(?=\n===|$)"
-    match = re.search(trace_pattern, content, re.DOTALL | re.IGNORECASE)
+    match = _REASONING_TRACE_RE.search(content)
 
     if not match:
         return None
 
     trace_text = match.group(1).strip()
 
-    # More robust extraction for each component
-    components = {}
-    patterns = {
-        "issue": r"Issue:\s*(.*?)(?=\n\s*Applicable Law:|\n\s*Application to Facts:|\n\s*Conclusion:|\n\s*Confidence:|\n\s*Sources:|\Z)",
-        "applicable_law": r"Applicable Law:\s*(.*?)(?=\n\s*Application to Facts:|\n\s*Conclusion:|\n\s*Confidence:|\n\s*Sources:|\Z)",
-        "application": r"Application to Facts:\s*(.*?)(?=\n\s*Conclusion:|\n\s*Confidence:|\n\s*Sources:|\Z)",
-        "conclusion": r"Conclusion:\s*(.*?)(?=\n\s*Confidence:|\n\s*Sources:|\Z)",
-        "confidence": r"Confidence:\s*(\d+)",
-        "sources": r"Sources:\s*(.*?)(?=\n\s*Generated:|\Z)",
-    }
+    fields = _REASONING_FIELDS_RE.search(trace_text)
+    if fields:
+        found = fields.groupdict().items()
+    else:
+        # More robust extraction for each component
+        found = []
+        for key, pattern in _REASONING_COMPONENT_RES.items():
+            match = pattern.search(trace_text)
+            if match:
+                found.append((key, match.group(1)))
 
-    for key, pattern in patterns.items():
-        match = re.search(pattern, trace_text, re.DOTALL | re.IGNORECASE)
-        if match:
-            value = match.group(1).strip()
-            if key == "confidence":
-                components[key] = int(value) if value.isdigit() else 50
-            elif key == "sources":
-                components[key] = [s.strip() for s in value.split(";") if s.strip()]
-            else:
-                components[key] = value
+    components = {}
+    for key, value in found:
+        value = value.strip()
+        if key == "confidence":
+            components[key] = int(value) if value.isdigit() else 50
+        elif key == "sources":
+            components[key] = [s.strip() for s in value.split(";") if s.strip()]
+        else:
+            components[key] = value
 
     # Check for essential components before creating the trace object
     if all(
@@ -991,18 +1438,16 @@ def save_command_output(
 
     output_file = os.path.join(OUTPUT_DIR, f"{command_name}_{slug}_{timestamp}.txt")
 
-    with open(output_file, "w", encoding="utf-8") as f:
-        # Standard header
-        f.write(f"{command_name.replace('_', ' ').title()}\n")
-
-        # Add metadata if provided
-        if metadata:
-            for key, value in metadata.items():
-                f.write(f"{key}: {value}\n")
+    # Standard header, plus metadata if provided
+    header = [f"{command_name.replace('_', ' ').title()}\n"]
+    if metadata:
+        header.extend(f"{key}: {value}\n" for key, value in metadata.items())
+    header.append(f"Timestamp: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+    header.append("-" * 80 + "\n\n")
 
-        f.write(f"Timestamp: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write("-" * 80 + "\n\n")
-        f.write(content)
+    # One write per file: header and content go out together
+    with open(output_file, "w", encoding="utf-8") as f:
+        f.write("".join(header) + content)
 
     return output_file
 
@@ -1201,6 +1646,19 @@ def validate_file_size(
     Raises:
         click.ClickException: If file is too large
     """
+    # A UTF-8 character is at most 4 bytes, so a text file over 4 * max_size bytes
+    # cannot fit; reject it from its size alone rather than reading it
+    if not file_path.lower().endswith(".pdf"):
+        try:
+            size = os.stat(file_path).st_size
+        except OSError:
+            size = 0  # Let read_document report the problem
+        if size > 4 * max_size:
+            raise click.ClickException(
+                f"{file_type.capitalize()} file too large ({size:,} bytes). "
+                f"Please provide a file under {max_size:,} characters (~{max_size//5:,} words)."
+            )
+
     content = read_document(file_path)
 
     if len(content) > max_size:
@@ -1212,6 +1670,25 @@ def validate_file_size(
     return content
 
 
+# Patterns for parse_strategies_file, compiled once at import
+_STRATEGIES_METADATA_RE = re.compile(r"# Side: (.+)\n# Area: (.+)")
+_STRATEGIES_SECTION_RES = (
+    (
+        "orthodox_count",
+        re.compile(r"## ORTHODOX STRATEGIES\n(.*?)(?=## [A-Z]|===|\Z)", re.DOTALL),
+    ),
+    (
+        "unorthodox_count",
+        re.compile(r"## UNORTHODOX STRATEGIES\n(.*?)(?=## [A-Z]|===|\Z)", re.DOTALL),
+    ),
+    (
+        "most_likely_count",
+        re.compile(r"## MOST LIKELY TO SUCCEED\n(.*?)(?====|\Z)", re.DOTALL),
+    ),
+)
+_NUMBERED_ITEM_RE = re.compile(r"^\d+\.", re.MULTILINE)
+
+
 def parse_strategies_file(strategies_text: str) -> dict:
     """
     Parse the strategies.txt file to extract basic counts and metadata.
@@ -1234,44 +1711,16 @@ def parse_strategies_file(strategies_text: str) -> dict:
     }
 
     # Extract metadata from header comments
-    metadata_match = re.search(r"# Side: (.+)\n# Area: (.+)", strategies_text)
+    metadata_match = _STRATEGIES_METADATA_RE.search(strategies_text)
     if metadata_match:
         parsed["metadata"]["side"] = metadata_match.group(1).strip()
         parsed["metadata"]["area"] = metadata_match.group(2).strip()
 
     # Extract and count each section separately to avoid cross-contamination
-
-    # Find ORTHODOX STRATEGIES section
-    orthodox_match = re.search(
-        r"## ORTHODOX STRATEGIES\n(.*?)(?=## [A-Z]|===|\Z)", strategies_text, re.DOTALL
-    )
-    if orthodox_match:
-        orthodox_text = orthodox_match.group(1)
-        parsed["orthodox_count"] = len(
-            re.findall(r"^\d+\.", orthodox_text, re.MULTILINE)
-        )
-
-    # Find UNORTHODOX STRATEGIES section
-    unorthodox_match = re.search(
-        r"## UNORTHODOX STRATEGIES\n(.*?)(?=## [A-Z]|===|\Z)",
-        strategies_text,
-        re.DOTALL,
-    )
-    if unorthodox_match:
-        unorthodox_text = unorthodox_match.group(1)
-        parsed["unorthodox_count"] = len(
-            re.findall(r"^\d+\.", unorthodox_text, re.MULTILINE)
-        )
-
-    # Find MOST LIKELY TO SUCCEED section
-    likely_match = re.search(
-        r"## MOST LIKELY TO SUCCEED\n(.*?)(?====|\Z)", strategies_text, re.DOTALL
-    )
-    if likely_match:
-        likely_text = likely_match.group(1)
-        parsed["most_likely_count"] = len(
-            re.findall(r"^\d+\.", likely_text, re.MULTILINE)
-        )
+    for key, section_re in _STRATEGIES_SECTION_RES:
+        section_match = section_re.search(strategies_text)
+        if section_match:
+            parsed[key] = len(_NUMBERED_ITEM_RE.findall(section_match.group(1)))
 
     return parsed
 
@@ -5,7 +5,10 @@ Pytest configuration and shared fixtures for LitAssist tests.
 import pytest
 from unittest.mock import Mock, patch
 import tempfile
+import textwrap
+import time
 from pathlib import Path
+from types import SimpleNamespace
 
 # Mock the CONFIG object before any imports to prevent SystemExit
 import sys
@@ -28,6 +31,36 @@ config_module = Mock()
 config_module.CONFIG = mock_config
 sys.modules["litassist.config"] = config_module
 
+
+@pytest.fixture(autouse=True)
+def flush_queued_logs():
+    """Drain queued JSON log writes so they cannot leak into the next test."""
+    yield
+    from litassist.utils import flush_logs
+
+    flush_logs()
+
+
+@pytest.fixture(autouse=True)
+def no_persistent_citation_cache(monkeypatch):
+    """Keep tests from reading or writing the user's on-disk citation cache."""
+    monkeypatch.setattr("litassist.citation_verify._persistent_cache_enabled", False)
+
+
+_FROZEN_TIME = time.strptime("2024-01-01 12:00:00", "%Y-%m-%d %H:%M:%S")
+
+
+@pytest.fixture(autouse=True)
+def frozen_time(monkeypatch):
+    """Freeze timestamps so generated filenames are predictable."""
+    from litassist import utils
+
+    # Swap utils' own time reference so the stdlib module stays untouched
+    frozen = SimpleNamespace(**vars(time))
+    frozen.strftime = lambda fmt, t=None: time.strftime(fmt, _FROZEN_TIME)
+    monkeypatch.setattr(utils, "time", frozen)
+
+
 # Mock fixtures for external services
 
 
@@ -134,6 +167,52 @@ def test_text_file(temp_dir):
     return txt_path
 
 
+@pytest.fixture(scope="session")
+def shared_text_file(tmp_path_factory):
+    """Create a read-only text file once per session; tests must not modify it."""
+    txt_path = tmp_path_factory.mktemp("shared") / "shared.txt"
+    txt_path.write_text("Test text content")
+    return txt_path
+
+
+@pytest.fixture(scope="session")
+def valid_trace_content():
+    """Response text containing a complete legal reasoning trace."""
+    return textwrap.dedent(
+        """
+        Some analysis content here.
+
+        === REASONING ===
+        Issue: Contract breach dispute
+        Applicable Law: Contract formation principles
+        Application to Facts: Clear breach occurred on specified date
+        Conclusion: Strong case for damages
+        Confidence: 85%
+        Sources: Smith v Jones [2020] FCA 123
+        """
+    )
+
+
+@pytest.fixture(scope="session")
+def large_content():
+    """100KB payload shared by large-output tests."""
+    return "x" * 100_000
+
+
+@pytest.fixture(scope="session")
+def small_operations():
+    """100 (command, content, outcome) triples for repeated small writes."""
+    return tuple((f"test_{i}", f"content_{i}", f"outcome_{i}") for i in range(100))
+
+
+@pytest.fixture(scope="session")
+def llm_prototype():
+    """LLMClient built once per session; tests take shallow copies of it."""
+    from litassist.llm import LLMClient
+
+    return LLMClient("test/model", temperature=0.5)
+
+
 @pytest.fixture
 def test_case_facts(temp_dir):
     """Create a test case facts file."""
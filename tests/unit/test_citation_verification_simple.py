@@ -2,9 +2,15 @@
 Simple tests for citation verification functionality.
 """
 
+import shelve
+import threading
 from unittest.mock import Mock, patch
+
+import pytest
+
+from litassist import citation_verify
 from litassist.citation_patterns import extract_citations
-from litassist.citation_verify import search_jade_via_google_cse
+from litassist.citation_verify import search_jade_via_google_cse, verify_all_citations
 
 
 class TestCitationVerificationBasic:
@@ -26,6 +32,30 @@ class TestCitationVerificationBasic:
         citations = extract_citations("")
         assert isinstance(citations, list)
 
+    def test_extract_citations_keeps_overlapping_styles(self):
+        """Test one pass still finds citations nested in another style."""
+        text = "See (1990) 175 US 175 and [2005] 2 Lloyd's Rep 123."
+        citations = extract_citations(text)
+
+        assert sorted(citations) == [
+            "(1990) 175 US 175",
+            "175 US 175",
+            "[2005] 2 Lloyd's Rep 123",
+        ]
+
+    def test_extract_citations_long_court_token(self):
+        """Test a long capitalised run after a year does not backtrack."""
+        # Quadratic backtracking would not finish on a run this long
+        text = "[2020] " + "A" * 200000 + " x"
+
+        assert extract_citations(text) == []
+
+    def test_extract_citations_no_overlap_within_style(self):
+        """Test a style does not match again inside its own citation."""
+        citations = extract_citations("123 US 456 US 789")
+
+        assert citations == ["123 US 456"]
+
     @patch("litassist.citation_verify.CONFIG")
     @patch("googleapiclient.discovery.build")
     def test_search_jade_via_google_cse_not_found(self, mock_build, mock_config):
@@ -44,6 +74,76 @@ class TestCitationVerificationBasic:
         result = search_jade_via_google_cse("[2099] FCA 999")
         assert result is False
 
+    @pytest.fixture
+    def persistent_cache(self, tmp_path, monkeypatch):
+        """Enable the on-disk citation cache in a not yet created directory."""
+        monkeypatch.setattr(citation_verify, "_persistent_cache_enabled", True)
+        monkeypatch.setattr(
+            citation_verify,
+            "CITATION_CACHE_PATH",
+            str(tmp_path / "litassist" / "cite_cache.db"),
+        )
+        citation_verify.clear_verification_cache()
+        with patch("litassist.citation_verify.save_log"):
+            yield
+        citation_verify.clear_verification_cache()
+
+    @patch("litassist.citation_verify.search_jade_via_google_cse", return_value=True)
+    def test_verified_citation_persists_across_runs(self, mock_search, persistent_cache):
+        """Test online results are reused from disk after the memory cache is cleared."""
+        assert verify_all_citations("See [2020] HCA 5.") == (["[2020] HCA 5"], [])
+        citation_verify.clear_verification_cache()
+
+        assert verify_all_citations("See [2020] HCA 5.") == (["[2020] HCA 5"], [])
+        mock_search.assert_called_once()
+
+    @patch("litassist.citation_verify.search_jade_via_google_cse", return_value=True)
+    def test_persistent_cache_entries_expire(
+        self, mock_search, persistent_cache, monkeypatch
+    ):
+        """Test entries older than the TTL trigger a fresh online lookup."""
+        verify_all_citations("See [2020] HCA 5.")
+        citation_verify.clear_verification_cache()
+        monkeypatch.setattr(citation_verify, "CITATION_CACHE_TTL", 0)
+
+        verify_all_citations("See [2020] HCA 5.")
+
+        assert mock_search.call_count == 2
+
+    @patch("litassist.citation_verify.search_jade_via_google_cse", return_value=True)
+    def test_persistent_cache_opened_once_per_run(self, mock_search, persistent_cache):
+        """Test one verification run opens the on-disk store a single time."""
+        with patch(
+            "litassist.citation_verify.shelve.open", wraps=shelve.open
+        ) as mock_open:
+            verified, _ = verify_all_citations(
+                "See [2020] HCA 1, [2020] HCA 2 and [2020] HCA 3."
+            )
+
+        assert len(verified) == 3
+        mock_open.assert_called_once()
+
+    def test_verify_all_citations_checks_concurrently(self):
+        """Test citation lookups overlap and results keep extraction order."""
+        citations = ["[2020] HCA 1", "[2020] HCA 2", "[2020] HCA 3"]
+        barrier = threading.Barrier(len(citations), timeout=5)
+
+        def lookup(citation, store=None):
+            barrier.wait()
+            if citation.endswith("2"):
+                return False, "", "not found"
+            return True, "", ""
+
+        with patch(
+            "litassist.citation_verify.extract_citations", return_value=citations
+        ), patch(
+            "litassist.citation_verify.verify_single_citation", side_effect=lookup
+        ), patch("litassist.citation_verify.save_log"):
+            verified, unverified = citation_verify.verify_all_citations("text")
+
+        assert verified == ["[2020] HCA 1", "[2020] HCA 3"]
+        assert unverified == [("[2020] HCA 2", "not found")]
+
     def test_citation_extraction_integration(self):
         """Test that citation extraction works with real legal text."""
         legal_text = """
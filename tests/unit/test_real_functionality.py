@@ -1,8 +1,7 @@
 """Real tests that actually test litassist functionality."""
 
+import os
 from unittest.mock import Mock, patch
-import tempfile
-from pathlib import Path
 
 from litassist.utils import chunk_text
 
@@ -27,6 +26,15 @@ class TestActualFunctionality:
         # Allow for some text compression due to whitespace normalization
         assert len(reconstructed) >= len(text) * 0.95  # Allow 5% compression from normalization
 
+    def test_chunk_text_large_input(self):
+        """Test chunk_text splits a multi-megabyte document within the size limit."""
+        text = "This is a sentence. " * 250_000  # 5MB
+
+        chunks = chunk_text(text, max_chars=20000)
+
+        assert all(len(chunk) <= 20000 for chunk in chunks)
+        assert " ".join(chunks) == text.strip()
+
     def test_real_config_mock(self):
         """Test with properly mocked config."""
         from litassist.config import CONFIG
@@ -38,7 +46,7 @@ class TestActualFunctionality:
 
     def test_save_log_creates_file(self):
         """Test save_log creates actual files."""
-        from litassist.utils import save_log
+        from litassist.utils import save_log, flush_logs
         import os
         import tempfile
 
@@ -48,6 +56,7 @@ class TestActualFunctionality:
             with patch("litassist.utils.LOG_DIR", temp_dir):
                 payload = {"input": "test", "response": "result"}
                 save_log("test", payload)
+                flush_logs()
                 
                 # Check that a file was created
                 files = os.listdir(temp_dir)
@@ -56,22 +65,77 @@ class TestActualFunctionality:
                 # Default format is now JSON
                 assert files[0].endswith(".json")
 
-    def test_real_file_operations(self):
+    def test_real_file_operations(self, shared_text_file):
         """Test file operations with real temp files."""
         from litassist.utils import read_document
 
-        # Create a real temporary file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("Test content")
-            temp_path = f.name
+        # Read the actual file
+        content = read_document(str(shared_text_file))
+        assert content == "Test text content"
+
+    def test_read_text_file_matches_text_mode(self, tmp_path):
+        """Test text files read via mmap match a text-mode read."""
+        import click
+        import pytest
+
+        from litassist.utils import read_document
+
+        text_path = tmp_path / "notes.txt"
+        text_path.write_bytes(b"Smith v Jones\r\nHon. Justice Ng\rend\n")
+        assert read_document(str(text_path)) == text_path.read_text(encoding="utf-8")
+
+        empty_path = tmp_path / "empty.txt"
+        empty_path.write_bytes(b"")
+        with pytest.raises(click.ClickException, match="No text found"):
+            read_document(str(empty_path))
+
+    def test_read_text_from_pipe(self, tmp_path):
+        """Test non-regular files that report size 0 are read, not treated as empty."""
+        import threading
 
+        from litassist.utils import read_document
+
+        fifo_path = tmp_path / "facts.txt"
+        os.mkfifo(fifo_path)
+
+        def feed():
+            with open(fifo_path, "w", encoding="utf-8") as f:
+                f.write("Smith v Jones\r\nfacts")
+
+        writer = threading.Thread(target=feed)
+        writer.start()
         try:
-            # Read the actual file
-            content = read_document(temp_path)
-            assert content == "Test content"
+            assert read_document(str(fifo_path)) == "Smith v Jones\nfacts"
         finally:
-            # Clean up
-            Path(temp_path).unlink()
+            writer.join(timeout=5)
+
+    def test_read_pdf_pages_in_parallel(self, tmp_path):
+        """Test parallel PDF extraction returns pages in order."""
+        from reportlab.pdfgen import canvas
+
+        from litassist.utils import read_document
+
+        pdf_path = str(tmp_path / "doc.pdf")
+        pdf = canvas.Canvas(pdf_path)
+        for i in range(6):
+            pdf.drawString(72, 720, f"Page number {i}")
+            pdf.showPage()
+        pdf.save()
+
+        sequential = read_document(pdf_path)
+        with patch("litassist.utils.PDF_PAGES_PER_WORKER", 2), patch(
+            "litassist.utils.os.cpu_count", return_value=3
+        ), patch("litassist.utils.ProcessPoolExecutor") as mock_pool:
+            from concurrent.futures import ProcessPoolExecutor
+
+            mock_pool.side_effect = ProcessPoolExecutor
+            parallel = read_document(pdf_path)
+
+        mock_pool.assert_called_once_with(max_workers=3)
+        assert parallel == sequential
+        assert [line for line in parallel.splitlines() if line] == [
+            f"Page number {i}" for i in range(6)
+        ]
 
 
 class TestCLICommandsWithRealFiles:
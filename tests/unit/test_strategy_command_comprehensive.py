@@ -6,9 +6,9 @@ All tests run offline using mocked dependencies.
 """
 
 import pytest
-import tempfile
-from pathlib import Path
-from unittest.mock import patch, MagicMock, Mock
+import textwrap
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock
 from click.testing import CliRunner
 import click
 
@@ -17,158 +17,312 @@ from litassist.commands.strategy import (
     validate_case_facts_format,
     extract_legal_issues,
     create_consolidated_reasoning_trace,
+    classify_outcome,
 )
+from litassist.utils import parse_strategies_file
 
+# Case facts with all 10 required headings, shared by the command tests
+_VALID_FACTS = textwrap.dedent(
+    """
+    Parties:
+    John Smith v ABC Corporation
 
-class TestCaseFactsValidation:
-    """Test case facts format validation functionality."""
+    Background:
+    Contract dispute case
 
-    def test_validate_case_facts_format_valid_standard(self):
-        """Test valid case facts with standard 10-heading structure."""
-        content = """
-        Parties:
-        John Smith v ABC Corporation
-        
-        Background:
-        Test background information
-        
-        Key Events:
-        Timeline of events
-        
-        Legal Issues:
-        Contract breach and negligence
-        
-        Evidence Available:
-        Documents and witnesses
-        
-        Opposing Arguments:
-        Defendant's position
-        
-        Procedural History:
-        Previous court proceedings
-        
-        Jurisdiction:
-        Federal Court of Australia
-        
-        Applicable Law:
-        Contract law and tort law
-        
-        Client Objectives:
-        Seek damages and injunction
-        """
-        assert validate_case_facts_format(content) is True
+    Key Events:
+    Contract signed and breached
 
-    def test_validate_case_facts_format_valid_flexible(self):
-        """Test valid case facts with flexible formatting."""
-        content = """
-        1. PARTIES:
-        John Smith v ABC Corporation
-        
-        2. BACKGROUND:
-        Test background
-        
-        3. KEY EVENTS:
-        Timeline
-        
-        4. LEGAL ISSUES:
-        Contract breach
-        
-        5. EVIDENCE AVAILABLE:
-        Documents
-        
-        6. OPPOSING ARGUMENTS:
-        Defense position
-        
-        7. PROCEDURAL HISTORY:
-        Court history
-        
-        8. JURISDICTION:
-        Federal Court
-        
-        9. APPLICABLE LAW:
-        Contract law
-        
-        10. CLIENT OBJECTIVES:
-        Damages
-        """
-        assert validate_case_facts_format(content) is True
+    Legal Issues:
+    Breach of contract
 
-    def test_validate_case_facts_format_case_insensitive(self):
-        """Test validation is case insensitive."""
-        content = """
-        parties:
-        John Smith v ABC Corporation
-        
-        background:
-        Test background
-        
-        key events:
-        Timeline
-        
-        legal issues:
-        Contract breach
-        
-        evidence available:
-        Documents
-        
-        opposing arguments:
-        Defense
-        
-        procedural history:
-        History
-        
-        jurisdiction:
-        Federal Court
-        
-        applicable law:
-        Contract law
-        
-        client objectives:
-        Damages
-        """
-        assert validate_case_facts_format(content) is True
+    Evidence Available:
+    Contract documents
 
-    def test_validate_case_facts_format_missing_headings(self):
-        """Test detection of missing required headings."""
-        content = """
-        Parties:
-        John Smith v ABC Corporation
-        
-        Background:
-        Test background
-        
-        Key Events:
-        Timeline
-        """
-        assert validate_case_facts_format(content) is False
+    Opposing Arguments:
+    No breach occurred
 
-    def test_validate_case_facts_format_partial_headings(self):
-        """Test with some but not all headings present."""
-        content = """
-        Parties:
-        John Smith v ABC Corporation
-        
-        Background:
-        Test background
-        
-        Legal Issues:
-        Contract breach
-        
-        Jurisdiction:
-        Federal Court
-        
-        Client Objectives:
-        Damages
-        """
-        assert validate_case_facts_format(content) is False
+    Procedural History:
+    No prior proceedings
+
+    Jurisdiction:
+    Federal Court of Australia
+
+    Applicable Law:
+    Contract law
+
+    Client Objectives:
+    Obtain damages
+    """
+).strip()
+
+# All 10 headings present but nothing under Legal Issues
+_NO_LEGAL_ISSUES_FACTS = textwrap.dedent(
+    """
+    Parties:
+    John Smith v ABC Corporation
+
+    Background:
+    Test background
+
+    Key Events:
+    Test events
+
+    Legal Issues:
+
+    Evidence Available:
+    Documents
+
+    Opposing Arguments:
+    Defense
+
+    Procedural History:
+    History
+
+    Jurisdiction:
+    Federal Court
+
+    Applicable Law:
+    Contract law
+
+    Client Objectives:
+    Damages
+    """
+).strip()
+
+_STRATEGIES_TEXT = textwrap.dedent(
+    """
+    ## ORTHODOX STRATEGIES
+
+    1. Direct contract breach claim
+    Standard approach to contract breach litigation.
+
+    2. Alternative dispute resolution
+    Mediation before court proceedings.
+
+    ## MOST LIKELY TO SUCCEED
+
+    1. Interim injunction application
+    High probability of success given evidence.
+
+    2. Summary judgment motion
+    Clear breach with strong documentation.
+    """
+).strip()
+_STRATEGIES_BYTES = _STRATEGIES_TEXT.encode("utf-8")
+
+_FACTS_PRESETS = {
+    "valid": _VALID_FACTS,
+    "empty_issues": _NO_LEGAL_ISSUES_FACTS,
+    "invalid": "Invalid case facts content without proper headings",
+}
+
+
+# Standard 10-heading structure
+_VALID_STANDARD_FACTS = textwrap.dedent(
+    """
+    Parties:
+    John Smith v ABC Corporation
+
+    Background:
+    Test background information
+
+    Key Events:
+    Timeline of events
+
+    Legal Issues:
+    Contract breach and negligence
+
+    Evidence Available:
+    Documents and witnesses
 
-    def test_validate_case_facts_format_empty_content(self):
-        """Test validation with empty content."""
-        assert validate_case_facts_format("") is False
+    Opposing Arguments:
+    Defendant's position
 
-    def test_validate_case_facts_format_whitespace_only(self):
-        """Test validation with whitespace-only content."""
-        assert validate_case_facts_format("   \n\n   \t   ") is False
+    Procedural History:
+    Previous court proceedings
+
+    Jurisdiction:
+    Federal Court of Australia
+
+    Applicable Law:
+    Contract law and tort law
+
+    Client Objectives:
+    Seek damages and injunction
+    """
+).strip()
+
+# Numbered, upper-case headings
+_VALID_FLEXIBLE_FACTS = textwrap.dedent(
+    """
+    1. PARTIES:
+    John Smith v ABC Corporation
+
+    2. BACKGROUND:
+    Test background
+
+    3. KEY EVENTS:
+    Timeline
+
+    4. LEGAL ISSUES:
+    Contract breach
+
+    5. EVIDENCE AVAILABLE:
+    Documents
+
+    6. OPPOSING ARGUMENTS:
+    Defense position
+
+    7. PROCEDURAL HISTORY:
+    Court history
+
+    8. JURISDICTION:
+    Federal Court
+
+    9. APPLICABLE LAW:
+    Contract law
+
+    10. CLIENT OBJECTIVES:
+    Damages
+    """
+).strip()
+
+# Lower-case headings
+_VALID_LOWERCASE_FACTS = textwrap.dedent(
+    """
+    parties:
+    John Smith v ABC Corporation
+
+    background:
+    Test background
+
+    key events:
+    Timeline
+
+    legal issues:
+    Contract breach
+
+    evidence available:
+    Documents
+
+    opposing arguments:
+    Defense
+
+    procedural history:
+    History
+
+    jurisdiction:
+    Federal Court
+
+    applicable law:
+    Contract law
+
+    client objectives:
+    Damages
+    """
+).strip()
+
+# Only the first three headings
+_MISSING_HEADINGS_FACTS = textwrap.dedent(
+    """
+    Parties:
+    John Smith v ABC Corporation
+
+    Background:
+    Test background
+
+    Key Events:
+    Timeline
+    """
+).strip()
+
+# Five of the ten headings
+_PARTIAL_HEADINGS_FACTS = textwrap.dedent(
+    """
+    Parties:
+    John Smith v ABC Corporation
+
+    Background:
+    Test background
+
+    Legal Issues:
+    Contract breach
+
+    Jurisdiction:
+    Federal Court
+
+    Client Objectives:
+    Damages
+    """
+).strip()
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """Share one CliRunner across the command tests; invoke() keeps no state."""
+    return CliRunner()
+
+
+@pytest.fixture
+def strategy_mocks(monkeypatch):
+    """Replace the strategy command's LLM, output and prompt dependencies."""
+    from litassist.commands import strategy as strategy_module
+
+    mocks = SimpleNamespace(
+        llm=MagicMock(),
+        save_out=MagicMock(return_value="outputs/strategy_test.txt"),
+        save_log=MagicMock(),
+        verify=MagicMock(return_value=("Verified content", {})),
+        prompts=MagicMock(),
+    )
+    monkeypatch.setattr(
+        strategy_module.LLMClientFactory, "for_command", lambda *a, **k: mocks.llm
+    )
+    monkeypatch.setattr(strategy_module, "save_command_output", mocks.save_out)
+    monkeypatch.setattr(strategy_module, "save_log", mocks.save_log)
+    monkeypatch.setattr(strategy_module, "verify_content_if_needed", mocks.verify)
+    monkeypatch.setattr(strategy_module, "PROMPTS", mocks.prompts)
+    return mocks
+
+
+@pytest.fixture
+def facts_text(request):
+    """Return a _FACTS_PRESETS entry (default "valid"); parametrize indirectly.
+
+    Tests pass "-" as the case facts path and feed this text through the
+    runner's stdin, so no facts file is written to disk.
+    """
+    return _FACTS_PRESETS[getattr(request, "param", "valid")]
+
+
+class TestCaseFactsValidation:
+    """Test case facts format validation functionality."""
+
+    @pytest.mark.parametrize(
+        "content,expected",
+        [
+            (_VALID_STANDARD_FACTS, True),
+            (_VALID_FLEXIBLE_FACTS, True),
+            (_VALID_LOWERCASE_FACTS, True),
+            (_MISSING_HEADINGS_FACTS, False),
+            (_PARTIAL_HEADINGS_FACTS, False),
+            ("", False),
+            ("   \n\n   \t   ", False),
+        ],
+        ids=[
+            "valid_standard",
+            "valid_flexible",
+            "case_insensitive",
+            "missing_headings",
+            "partial_headings",
+            "empty_content",
+            "whitespace_only",
+        ],
+    )
+    def test_validate_case_facts_format(self, content, expected):
+        """Test validation of the required 10-heading structure."""
+        assert validate_case_facts_format(content) is expected
 
 
 class TestLegalIssuesExtraction:
@@ -274,280 +428,126 @@ class TestLegalIssuesExtraction:
         assert "1. Contract breach" in issues
         assert "2. Negligence claim" in issues
 
+    def test_extract_legal_issues_stops_at_next_heading(self):
+        """Test extraction ends at whichever required heading follows."""
+        content = """
+        Legal Issues:
+        - Breach of s 18 - Australian Consumer Law
+        - Negligent misstatement
+
+        Jurisdiction:
+        Federal Court
+        """
+        issues = extract_legal_issues(content)
+        assert issues == [
+            "Breach of s 18 - Australian Consumer Law",
+            "Negligent misstatement",
+        ]
+
+    def test_extract_legal_issues_repeated_calls_independent(self):
+        """Test cached extraction returns a fresh list on every call."""
+        content = """
+        Legal Issues:
+        Breach of contract
+
+        Evidence Available:
+        Documents
+        """
+        first = extract_legal_issues(content)
+        first.append("Mutated by caller")
+        assert extract_legal_issues(content) == ["Breach of contract"]
+
 
 class TestStrategyGeneration:
     """Test strategy generation functionality."""
 
-    @patch("litassist.commands.strategy.LLMClientFactory.for_command")
-    @patch("litassist.commands.strategy.save_command_output")
-    @patch("litassist.commands.strategy.save_log")
-    @patch("litassist.commands.strategy.verify_content_if_needed")
-    @patch("litassist.commands.strategy.PROMPTS")
-    def test_strategy_generation_success(
-        self,
-        mock_prompts,
-        mock_verify,
-        mock_save_log,
-        mock_save_output,
-        mock_llm_factory,
-    ):
+    def test_strategy_generation_success(self, strategy_mocks, runner, facts_text):
         """Test successful strategy generation."""
-        # Mock prompts
-        mock_prompts.get.return_value = "Test prompt"
-
-        # Mock verification
-        mock_verify.return_value = ("Verified content", {})
+        strategy_mocks.prompts.get.return_value = "Test prompt"
+        strategy_mocks.verify.return_value = ("Verified content", {})
 
-        # Mock LLM client
-        mock_client = MagicMock()
+        mock_client = strategy_mocks.llm
         mock_client.complete.return_value = (
             "## OPTION 1: Apply for Interim Injunction\nDetailed strategy content...",
             {"total_tokens": 500, "prompt_tokens": 300, "completion_tokens": 200},
         )
         mock_client.validate_citations.return_value = []
-        mock_llm_factory.return_value = mock_client
-        mock_save_output.return_value = "outputs/strategy_test.txt"
-
-        # Create test case facts file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write(
-                """
-            Parties:
-            John Smith v ABC Corporation
-            
-            Background:
-            Contract dispute case
-            
-            Key Events:
-            Contract signed and breached
-            
-            Legal Issues:
-            Breach of contract
-            
-            Evidence Available:
-            Contract documents
-            
-            Opposing Arguments:
-            No breach occurred
-            
-            Procedural History:
-            No prior proceedings
-            
-            Jurisdiction:
-            Federal Court of Australia
-            
-            Applicable Law:
-            Contract law
-            
-            Client Objectives:
-            Obtain damages
-            """
-            )
-            facts_file = f.name
-
-        try:
-            runner = CliRunner()
-            with runner.isolated_filesystem():
-                result = runner.invoke(
-                    strategy,
-                    [facts_file, "--outcome", "Obtain interim injunction"],
-                    obj={"premium": False},
-                )
-
-            assert result.exit_code == 0
-            assert "Strategy generation complete!" in result.output
-            assert "Generated 4 strategic options" in result.output
-
-            # Verify LLM was called
-            mock_client.complete.assert_called()
-            mock_client.validate_citations.assert_called()
-
-        finally:
-            Path(facts_file).unlink()
-
-    @patch("litassist.commands.strategy.LLMClientFactory.for_command")
-    def test_strategy_generation_invalid_facts(self, mock_llm_factory):
-        """Test strategy generation with invalid case facts."""
-        # Create invalid case facts file (missing required headings)
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("Invalid case facts content without proper headings")
-            facts_file = f.name
-
-        try:
-            runner = CliRunner()
-            result = runner.invoke(strategy, [facts_file, "--outcome", "Test outcome"])
-
-            assert result.exit_code != 0
-            assert "does not follow the required 10-heading structure" in result.output
-
-        finally:
-            Path(facts_file).unlink()
-
-    @patch("litassist.commands.strategy.LLMClientFactory.for_command")
-    def test_strategy_generation_no_legal_issues(self, mock_llm_factory):
-        """Test strategy generation when no legal issues can be extracted."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write(
-                """
-            Parties:
-            John Smith v ABC Corporation
-            
-            Background:
-            Test background
-            
-            Key Events:
-            Test events
-            
-            Legal Issues:
-            
-            Evidence Available:
-            Documents
-            
-            Opposing Arguments:
-            Defense
-            
-            Procedural History:
-            History
-            
-            Jurisdiction:
-            Federal Court
-            
-            Applicable Law:
-            Contract law
-            
-            Client Objectives:
-            Damages
-            """
-            )
-            facts_file = f.name
 
-        try:
-            runner = CliRunner()
+        with runner.isolated_filesystem():
             result = runner.invoke(
                 strategy,
-                [facts_file, "--outcome", "Test outcome"],
+                ["-", "--outcome", "Obtain interim injunction"],
+                input=facts_text,
                 obj={"premium": False},
+                catch_exceptions=False,
             )
 
-            assert result.exit_code != 0
-            # The error message may vary - just check that it indicates an issue with legal issues or LLM generation
-            error_indicators = [
-                "Could not extract legal issues",
-                "Generation failed",
-                "not enough values to unpack",
-            ]
-            assert any(indicator in result.output for indicator in error_indicators)
-
-        finally:
-            Path(facts_file).unlink()
-
-    @patch("litassist.commands.strategy.LLMClientFactory.for_command")
-    @patch("litassist.commands.strategy.save_command_output")
-    @patch("litassist.commands.strategy.save_log")
-    @patch("litassist.commands.strategy.PROMPTS")
+        assert result.exit_code == 0
+        assert "Strategy generation complete!" in result.output
+        assert "Generated 4 strategic options" in result.output
+
+        # Verify LLM was called
+        mock_client.complete.assert_called()
+        mock_client.validate_citations.assert_called()
+
+    @pytest.mark.parametrize(
+        "facts_text,expected_error",
+        [
+            ("invalid", "does not follow the required 10-heading structure"),
+            ("empty_issues", "Could not extract legal issues"),
+        ],
+        indirect=["facts_text"],
+        ids=["invalid", "empty_issues"],
+    )
+    def test_strategy_generation_rejects_facts(
+        self, strategy_mocks, runner, facts_text, expected_error
+    ):
+        """Test strategy generation stops on unusable case facts."""
+        result = runner.invoke(
+            strategy,
+            ["-", "--outcome", "Test outcome"],
+            input=facts_text,
+            obj={"premium": False},
+        )
+
+        assert result.exit_code != 0
+        assert expected_error in result.output
+
     def test_strategy_generation_with_strategies_file(
-        self, mock_prompts, mock_save_log, mock_save_output, mock_llm_factory
+        self, strategy_mocks, runner, facts_text, tmp_path
     ):
         """Test strategy generation with brainstorm strategies file."""
-        # Mock prompts
-        mock_prompts.get.return_value = "Test prompt template"
+        strategy_mocks.prompts.get.return_value = "Test prompt template"
 
-        # Mock LLM client
-        mock_client = MagicMock()
+        mock_client = strategy_mocks.llm
         mock_client.complete.return_value = (
             "## OPTION 1: Enhanced Strategy\nBased on brainstormed content...",
             {"total_tokens": 600},
         )
         mock_client.validate_citations.return_value = []
-        mock_llm_factory.return_value = mock_client
-        mock_save_output.return_value = "outputs/strategy_test.txt"
-
-        # Create test files
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".txt", delete=False
-        ) as facts_f:
-            facts_f.write(
-                """
-            Parties:
-            John Smith v ABC Corporation
-            
-            Background:
-            Contract dispute
-            
-            Key Events:
-            Contract breach
-            
-            Legal Issues:
-            Breach of contract
-            
-            Evidence Available:
-            Contract documents
-            
-            Opposing Arguments:
-            No breach
-            
-            Procedural History:
-            None
-            
-            Jurisdiction:
-            Federal Court
-            
-            Applicable Law:
-            Contract law
-            
-            Client Objectives:
-            Damages
-            """
-            )
-            facts_file = facts_f.name
-
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".txt", delete=False
-        ) as strategies_f:
-            strategies_f.write(
-                """
-            ## ORTHODOX STRATEGIES
-            
-            1. Direct contract breach claim
-            Standard approach to contract breach litigation.
-            
-            2. Alternative dispute resolution
-            Mediation before court proceedings.
-            
-            ## MOST LIKELY TO SUCCEED
-            
-            1. Interim injunction application
-            High probability of success given evidence.
-            
-            2. Summary judgment motion
-            Clear breach with strong documentation.
-            """
-            )
-            strategies_file = strategies_f.name
-
-        try:
-            runner = CliRunner()
-            _ = runner.invoke(
-                strategy,
-                [
-                    facts_file,
-                    "--outcome",
-                    "Obtain interim injunction",
-                    "--strategies",
-                    strategies_file,
-                ],
-            )
 
-            # Test that the strategies file was processed (even if command failed later)
-            # The test successfully created the strategies file and invoked the command
-            assert strategies_file is not None
-            assert facts_file is not None
-            # Command was invoked with strategies file parameter
-            assert True  # This validates the test structure itself
+        strategies_file = tmp_path / "strategies.txt"
+        strategies_file.write_bytes(_STRATEGIES_BYTES)
+
+        _ = runner.invoke(
+            strategy,
+            [
+                "-",
+                "--outcome",
+                "Obtain interim injunction",
+                "--strategies",
+                str(strategies_file),
+            ],
+            input=facts_text,
+            catch_exceptions=False,
+        )
 
-        finally:
-            Path(facts_file).unlink()
-            Path(strategies_file).unlink()
+        # Test that the strategies file was processed (even if command failed later)
+        # The test successfully created the strategies file and invoked the command
+        assert strategies_file is not None
+        assert facts_text is not None
+        # Command was invoked with strategies file parameter
+        assert True  # This validates the test structure itself
 
 
 class TestReasoningTrace:
@@ -559,7 +559,7 @@ class TestReasoningTrace:
         trace_data = [
             {
                 "option_number": 1,
-                "trace": Mock(
+                "trace": SimpleNamespace(
                     issue="Contract breach",
                     applicable_law="Contract law principles",
                     application="Facts support breach claim",
@@ -570,7 +570,7 @@ class TestReasoningTrace:
             },
             {
                 "option_number": 2,
-                "trace": Mock(
+                "trace": SimpleNamespace(
                     issue="Negligence claim",
                     applicable_law="Tort law principles",
                     application="Duty of care established",
@@ -608,144 +608,74 @@ class TestReasoningTrace:
 class TestDocumentTypeSelection:
     """Test document type selection logic."""
 
-    def test_document_type_selection_injunction(self):
-        """Test document type selection for injunction outcomes."""
-        outcomes_requiring_application = [
-            "Obtain interim injunction",
-            "Seek restraining order",
-            "Apply for stay of proceedings",
-            "Request interlocutory relief",
-        ]
-
-        for outcome in outcomes_requiring_application:
-            # This would be tested as part of the strategy command integration
-            # The logic checks for keywords like "injunction", "order", "interim", "stay"
-            keywords = ["injunction", "order", "stay", "restraining", "interlocutory"]
-            has_keyword = any(term in outcome.lower() for term in keywords)
-            assert (
-                has_keyword
-            ), f"Outcome '{outcome}' should contain one of the keywords: {keywords}"
-
-    def test_document_type_selection_affidavit(self):
-        """Test document type selection for affidavit outcomes."""
-        outcomes_requiring_affidavit = [
-            "Prepare affidavit evidence",
-            "Gather witness statements",
-            "Document sworn testimony",
-        ]
-
-        for outcome in outcomes_requiring_affidavit:
-            assert any(
-                term in outcome.lower()
-                for term in ["affidavit", "evidence", "witness", "sworn"]
-            )
-
-    def test_document_type_selection_default_claim(self):
-        """Test document type selection defaults to claim."""
-        outcomes_defaulting_to_claim = [
-            "Obtain damages",
-            "Seek compensation",
-            "Recover debt",
-            "General relief",
-        ]
-
-        for outcome in outcomes_defaulting_to_claim:
-            # Should not match injunction or affidavit keywords
-            assert not any(
-                term in outcome.lower()
-                for term in ["injunction", "order", "interim", "stay"]
-            )
-            assert not any(
-                term in outcome.lower()
-                for term in ["affidavit", "evidence", "witness", "sworn"]
-            )
+    @pytest.mark.parametrize(
+        "outcome,expected_doc_type",
+        [
+            ("Obtain interim injunction", "application"),
+            ("Seek restraining order", "application"),
+            ("Apply for stay of proceedings", "application"),
+            ("Request interlocutory relief", "application"),
+            ("Prepare affidavit evidence", "affidavit"),
+            ("Gather witness statements", "affidavit"),
+            ("Document sworn testimony", "affidavit"),
+            ("Obtain damages", "claim"),
+            ("Seek compensation", "claim"),
+            ("Recover debt", "claim"),
+            ("General relief", "claim"),
+        ],
+    )
+    def test_document_type_selection(self, outcome, expected_doc_type):
+        """Test document type selection from outcome keywords."""
+        assert classify_outcome(outcome) == expected_doc_type
 
 
 class TestErrorHandling:
     """Test error handling scenarios."""
 
-    @patch("litassist.commands.strategy.LLMClientFactory.for_command")
-    def test_strategy_generation_llm_failure(self, mock_llm_factory):
+    def test_strategy_generation_llm_failure(self, strategy_mocks, runner, facts_text):
         """Test handling of LLM generation failures."""
-        # Mock LLM client that raises exception
-        mock_client = MagicMock()
+        # LLM client that raises exception
+        mock_client = strategy_mocks.llm
         mock_client.complete.side_effect = Exception("LLM service unavailable")
-        mock_llm_factory.return_value = mock_client
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write(
-                """
-            Parties:
-            John Smith v ABC Corporation
-            
-            Background:
-            Test background
-            
-            Key Events:
-            Test events
-            
-            Legal Issues:
-            Contract breach
-            
-            Evidence Available:
-            Documents
-            
-            Opposing Arguments:
-            Defense
-            
-            Procedural History:
-            History
-            
-            Jurisdiction:
-            Federal Court
-            
-            Applicable Law:
-            Contract law
-            
-            Client Objectives:
-            Damages
-            """
-            )
-            facts_file = f.name
-
-        try:
-            runner = CliRunner()
-            result = runner.invoke(strategy, [facts_file, "--outcome", "Test outcome"])
 
-            # Test that the LLM failure was properly set up
-            assert mock_client.complete.side_effect is not None
-            # The command should fail due to the LLM exception
-            assert result.exit_code != 0
-            # Test validates the error handling structure is in place
-            assert True  # This validates the test structure itself
+        result = runner.invoke(
+            strategy, ["-", "--outcome", "Test outcome"], input=facts_text
+        )
 
-        finally:
-            Path(facts_file).unlink()
+        # Test that the LLM failure was properly set up
+        assert mock_client.complete.side_effect is not None
+        # The command should fail due to the LLM exception
+        assert result.exit_code != 0
+        # Test validates the error handling structure is in place
+        assert True  # This validates the test structure itself
 
     @patch("litassist.commands.strategy.validate_file_size_limit")
-    def test_strategy_generation_file_size_limit(self, mock_validate_size):
+    def test_strategy_generation_file_size_limit(self, mock_validate_size, runner):
         """Test handling of file size limit exceeded."""
         mock_validate_size.side_effect = click.ClickException("File size exceeds limit")
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("Test content")
-            facts_file = f.name
+        result = runner.invoke(
+            strategy, ["-", "--outcome", "Test outcome"], input="Test content"
+        )
+
+        assert result.exit_code != 0
+        assert "File size exceeds limit" in result.output
 
-        try:
-            runner = CliRunner()
-            result = runner.invoke(strategy, [facts_file, "--outcome", "Test outcome"])
+    def test_strategy_generation_missing_facts_file(self, runner, tmp_path):
+        """Test Click rejects a missing case facts file while parsing arguments."""
+        missing = tmp_path / "missing.txt"
 
-            assert result.exit_code != 0
-            assert "File size exceeds limit" in result.output
+        result = runner.invoke(strategy, [str(missing), "--outcome", "Test outcome"])
 
-        finally:
-            Path(facts_file).unlink()
+        assert result.exit_code == 2
+        assert "No such file or directory" in result.output
 
-    @patch("litassist.commands.strategy.LLMClientFactory.for_command")
-    def test_strategy_generation_citation_validation_warnings(self, mock_llm_factory):
+    def test_strategy_generation_citation_validation_warnings(
+        self, strategy_mocks, runner, facts_text
+    ):
         """Test handling of citation validation warnings."""
-        # Mock LLM client with citation issues
-        mock_client = MagicMock()
+        # LLM client with citation issues
+        mock_client = strategy_mocks.llm
         mock_client.complete.return_value = (
             "## OPTION 1: Test Strategy\nWith invalid citation [2025] FAKE 999",
             {"total_tokens": 500},
@@ -754,62 +684,18 @@ class TestErrorHandling:
             "Invalid citation format detected",
             "Citation [2025] FAKE 999 could not be verified",
         ]
-        mock_llm_factory.return_value = mock_client
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write(
-                """
-            Parties:
-            John Smith v ABC Corporation
-            
-            Background:
-            Test background
-            
-            Key Events:
-            Test events
-            
-            Legal Issues:
-            Contract breach
-            
-            Evidence Available:
-            Documents
-            
-            Opposing Arguments:
-            Defense
-            
-            Procedural History:
-            History
-            
-            Jurisdiction:
-            Federal Court
-            
-            Applicable Law:
-            Contract law
-            
-            Client Objectives:
-            Damages
-            """
-            )
-            facts_file = f.name
-
-        try:
-            runner = CliRunner()
-            with patch("litassist.commands.strategy.save_command_output") as mock_save:
-                with patch("litassist.commands.strategy.save_log"):
-                    mock_save.return_value = "test_output.txt"
-                    _ = runner.invoke(
-                        strategy, [facts_file, "--outcome", "Test outcome"]
-                    )
+        strategy_mocks.save_out.return_value = "test_output.txt"
 
-                    # May complete with warnings or fail due to citation issues
-                    # Since the CLI may fail before citation validation, just check that we set up the test correctly
-                    assert mock_client.validate_citations.return_value == [
-                        "Invalid citation format detected",
-                        "Citation [2025] FAKE 999 could not be verified",
-                    ]
+        _ = runner.invoke(
+            strategy, ["-", "--outcome", "Test outcome"], input=facts_text
+        )
 
-        finally:
-            Path(facts_file).unlink()
+        # May complete with warnings or fail due to citation issues
+        # Since the CLI may fail before citation validation, just check that we set up the test correctly
+        assert mock_client.validate_citations.return_value == [
+            "Invalid citation format detected",
+            "Citation [2025] FAKE 999 could not be verified",
+        ]
 
 
 class TestStrategyFileIntegration:
@@ -817,8 +703,6 @@ class TestStrategyFileIntegration:
 
     def test_parse_strategies_file_structured(self):
         """Test parsing of well-structured strategies file."""
-        from litassist.utils import parse_strategies_file
-
         strategies_content = """## ORTHODOX STRATEGIES
 
 1. Standard contract breach claim
@@ -849,8 +733,6 @@ Clear case with strong evidence.
 
     def test_parse_strategies_file_unstructured(self):
         """Test parsing of unstructured strategies content."""
-        from litassist.utils import parse_strategies_file
-
         strategies_content = """
         1. First strategy approach
         Details about the first strategy.
@@ -872,8 +754,6 @@ Clear case with strong evidence.
 
     def test_parse_strategies_file_empty(self):
         """Test parsing of empty strategies file."""
-        from litassist.utils import parse_strategies_file
-
         result = parse_strategies_file("")
 
         assert result["orthodox_count"] == 0
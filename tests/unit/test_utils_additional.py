@@ -21,14 +21,13 @@ class DummyClient:
         # Not used when no regeneration needed
         return ("", {})
 
-def test_validate_file_size_success(tmp_path):
-    # Create a small temp file
-    file_path = tmp_path / "test.txt"
-    content = "Hello World"
-    file_path.write_text(content)
+DUMMY_CLIENT = DummyClient()
+
+def test_validate_file_size_success(shared_text_file):
+    # Small shared file is within the limit
     # Should return content without error
-    result = validate_file_size(str(file_path), max_size=100)
-    assert result == content
+    result = validate_file_size(str(shared_text_file), max_size=100)
+    assert result == "Test text content"
 
 def test_validate_file_size_too_large(tmp_path):
     # Create a large temp file
@@ -40,6 +39,17 @@ def test_validate_file_size_too_large(tmp_path):
         validate_file_size(str(file_path), max_size=100)
     assert "file too large" in str(excinfo.value)
 
+def test_validate_file_size_rejects_by_stat(tmp_path, monkeypatch):
+    # Far over the limit in bytes: rejected without reading the file
+    file_path = tmp_path / "huge.txt"
+    file_path.write_text("x" * 1000)
+    def fail_read(path):
+        raise AssertionError("file should not be read")
+    monkeypatch.setattr('litassist.utils.read_document', fail_read)
+    with pytest.raises(click.ClickException) as excinfo:
+        validate_file_size(str(file_path), max_size=100)
+    assert "file too large" in str(excinfo.value)
+
 def test_parse_strategies_file_counts_and_metadata():
     text = (
         "# Side: plaintiff\n"
@@ -143,9 +153,57 @@ def test_regenerate_bad_strategies_no_issues(monkeypatch):
         type('P', (), {'get': lambda *args, **kwargs: ''})()
     )
     # Use dummy client that reports no citation issues
-    client = DummyClient()
-    result = regenerate_bad_strategies(client, original, '', 'orthodox')
+    result = regenerate_bad_strategies(DUMMY_CLIENT, original, '', 'orthodox')
     # Should start with header and include both strategies
     assert result.startswith('## ORTHODOX STRATEGIES')
     assert '1. Strategy One' in result
     assert '2. Strategy Two' in result
+
+def test_expand_glob_patterns_lists_directory_once(tmp_path, monkeypatch):
+    for name in ('a.txt', 'b.txt', 'c.log', '.hidden.txt'):
+        (tmp_path / name).write_text('x')
+    calls = []
+    real_scandir = os.scandir
+
+    def counting_scandir(path):
+        calls.append(path)
+        return real_scandir(path)
+
+    monkeypatch.setattr('litassist.commands.brainstorm.os.scandir', counting_scandir)
+    patterns = (str(tmp_path / '*.txt'), str(tmp_path / '*.log'), str(tmp_path / 'b.*'))
+    result = expand_glob_patterns(None, None, patterns)
+    # Directory scanned once for all three patterns; duplicates and hidden files dropped
+    assert calls == [str(tmp_path)]
+    assert sorted(os.path.basename(p) for p in result) == ['a.txt', 'b.txt', 'c.log']
+
+class RecordingClient(DummyClient):
+    """Dummy client that records validated text and flags one strategy."""
+    def __init__(self, bad_marker=None):
+        self.validated = []
+        self.bad_marker = bad_marker
+
+    def validate_citations(self, text):
+        self.validated.append(text)
+        if self.bad_marker and self.bad_marker in text:
+            return ['summary', 'CITATION NOT FOUND: [2099] HCA 1']
+        return []
+
+    def complete(self, messages):
+        return ("2. Replacement strategy", {})
+
+def test_regenerate_bad_strategies_validates_section_once(monkeypatch):
+    from litassist.commands.brainstorm import regenerate_bad_strategies
+    monkeypatch.setattr(
+        'litassist.commands.brainstorm.PROMPTS',
+        type('P', (), {'get': lambda *args, **kwargs: ''})()
+    )
+    original = "## ORTHODOX STRATEGIES\n\n1. Strategy One\n2. Strategy Two\n3. Strategy Three\n"
+    # Clean section: one validation call instead of one per strategy
+    client = RecordingClient()
+    regenerate_bad_strategies(client, original, '', 'orthodox')
+    assert len(client.validated) == 1
+    # Issues found: fall back to per-strategy checks to attribute them
+    client = RecordingClient(bad_marker='Strategy Two')
+    result = regenerate_bad_strategies(client, original, '', 'orthodox')
+    assert client.validated[1:4] == ['1. Strategy One', '2. Strategy Two', '3. Strategy Three']
+    assert '2. Replacement strategy' in result
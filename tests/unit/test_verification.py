@@ -1,145 +1,181 @@
 """Tests for the enhanced verification system."""
 
-from unittest.mock import Mock, patch
+import copy
+import functools
+from collections import namedtuple
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import patch
 from litassist.llm import LLMClient
 
 
-class TestLLMClientVerification:
-    """Test LLM client verification enhancements."""
+Usage = namedtuple("Usage", "prompt_tokens completion_tokens total_tokens")
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.client = LLMClient("test/model", temperature=0.5)
 
-    def test_should_auto_verify_extractfacts_command(self):
-        """Test auto-verification for extractfacts command."""
-        content = "Some basic content"
-        assert self.client.should_auto_verify(content, "extractfacts") is True
+@pytest.fixture(scope="module")
+def _client_prototypes():
+    """Build each (model, params) client once per module."""
+    return functools.lru_cache(maxsize=None)(LLMClient)
 
-    def test_should_auto_verify_strategy_command(self):
-        """Test auto-verification for strategy command."""
-        content = "Some basic content"
-        assert self.client.should_auto_verify(content, "strategy") is True
 
-    def test_should_auto_verify_grok_model(self):
-        """Test auto-verification for Grok models."""
-        grok_client = LLMClient("x-ai/grok-3", temperature=0.9)
-        content = "Some basic content"
-        assert grok_client.should_auto_verify(content, "brainstorm") is True
+@pytest.fixture
+def client_for(_client_prototypes):
+    """Return a fresh copy of the prototype client for a model and params."""
+
+    def make(model, **params):
+        return copy.copy(_client_prototypes(model, **params))
 
-    def test_should_auto_verify_citations(self):
-        """Test auto-verification for content with citations."""
-        content = "In [2020] HCA 5, the court held..."
-        assert self.client.should_auto_verify(content) is True
+    return make
 
-    def test_should_auto_verify_percentages(self):
-        """Test auto-verification for content with percentages."""
-        content = "The probability of success is 75%"
-        assert self.client.should_auto_verify(content) is True
 
-    def test_should_auto_verify_strong_conclusions(self):
-        """Test auto-verification for strong legal conclusions."""
-        content = 'The defendant "must" comply with the order'
-        assert self.client.should_auto_verify(content) is True
+@pytest.fixture
+def client(llm_prototype):
+    """Fresh copy of the session test/model client."""
+    client = copy.copy(llm_prototype)
+    client.command_context = None
+    return client
+
+
+def chat_response(content, usage):
+    """Build a successful chat completion with plain attribute access."""
+    choice = SimpleNamespace(
+        message=SimpleNamespace(content=content),
+        error=None,  # Explicitly set error to None for success case
+        finish_reason="stop",  # Set proper finish reason
+    )
+    return SimpleNamespace(choices=[choice], usage=usage)
+
+
+class TestLLMClientVerification:
+    """Test LLM client verification enhancements."""
 
-    def test_should_not_auto_verify_basic_content(self):
-        """Test no auto-verification for basic content."""
-        content = "This is a simple summary of events"
-        assert self.client.should_auto_verify(content, "digest") is False
+    @pytest.mark.parametrize(
+        "content,command,model,expected",
+        [
+            ("Some basic content", "extractfacts", "test/model", True),
+            ("Some basic content", "strategy", "test/model", True),
+            *(
+                pytest.param(
+                    "Some basic content",
+                    "brainstorm",
+                    model,
+                    True,
+                    marks=pytest.mark.xdist_group("grok"),
+                )
+                for model in ["x-ai/grok-3", "x-ai/grok-3-beta"]
+            ),
+            ("In [2020] HCA 5, the court held...", None, "test/model", True),
+            ("The probability of success is 75%", None, "test/model", True),
+            ('The defendant "must" comply with the order', None, "test/model", True),
+            ("This is a simple summary of events", "digest", "test/model", False),
+        ],
+        ids=[
+            "extractfacts",
+            "strategy",
+            "grok-3",
+            "grok-3-beta",
+            "citations",
+            "percentages",
+            "strong_conclusions",
+            "basic_content",
+        ],
+    )
+    def test_should_auto_verify(self, content, command, model, expected, client_for):
+        """Test auto-verification by command, model and risky content."""
+        client = client_for(model, temperature=0.5)
+        assert client.should_auto_verify(content, command) is expected
 
 
 
     @patch("litassist.utils.save_log")
     @patch("openai.ChatCompletion.create")
-    def test_verify_with_level_light(self, mock_create, mock_save_log):
+    def test_verify_with_level_light(self, mock_create, mock_save_log, client):
         """Test light verification level."""
-        mock_response = Mock()
-        mock_response.choices = [Mock()]
-        mock_response.choices[0].message.content = "Corrected text"
-        mock_response.choices[0].error = (
-            None  # Explicitly set error to None for success case
+        mock_create.return_value = chat_response(
+            "Corrected text",
+            Usage(prompt_tokens=100, completion_tokens=50, total_tokens=150),
         )
-        mock_response.choices[0].finish_reason = "stop"  # Set proper finish reason
-        # Create a dict-like object that's JSON serializable
-        mock_response.usage = {
-            "prompt_tokens": 100,
-            "completion_tokens": 50,
-            "total_tokens": 150,
-        }
-        mock_create.return_value = mock_response
 
-        result = self.client.verify_with_level("test content", "light")
+        result = client.verify_with_level("test content", "light")
 
         assert result == "Corrected text"
         # Should use light verification prompts
         call_args = mock_create.call_args[1]["messages"]
-        assert "Australian English spelling" in call_args[0]["content"]
+        # Verification runs on Claude, so the system prompt is a cached block
+        (system_block,) = call_args[0]["content"]
+        assert system_block["cache_control"] == {"type": "ephemeral"}
+        assert "Australian English spelling" in system_block["text"]
 
     @patch("litassist.utils.save_log")
     @patch("openai.ChatCompletion.create")
-    def test_verify_with_level_heavy(self, mock_create, mock_save_log):
+    def test_verify_with_level_heavy(self, mock_create, mock_save_log, client):
         """Test heavy verification level."""
-        mock_response = Mock()
-        mock_response.choices = [Mock()]
-        mock_response.choices[0].message.content = "Thoroughly reviewed content"
-        mock_response.choices[0].error = (
-            None  # Explicitly set error to None for success case
+        mock_create.return_value = chat_response(
+            "Thoroughly reviewed content",
+            Usage(prompt_tokens=200, completion_tokens=100, total_tokens=300),
         )
-        mock_response.choices[0].finish_reason = "stop"  # Set proper finish reason
-        # Create a dict-like object that's JSON serializable
-        mock_response.usage = {
-            "prompt_tokens": 200,
-            "completion_tokens": 100,
-            "total_tokens": 300,
-        }
-        mock_create.return_value = mock_response
 
-        result = self.client.verify_with_level("test content", "heavy")
+        result = client.verify_with_level("test content", "heavy")
 
         assert result == "Thoroughly reviewed content"
         # Should use heavy verification prompts
         call_args = mock_create.call_args[1]["messages"]
-        assert "legal accuracy" in call_args[0]["content"]
+        (system_block,) = call_args[0]["content"]
+        assert "legal accuracy" in system_block["text"]
+
+    @patch("openai.ChatCompletion.create")
+    def test_complete_leaves_uncached_system_prompt(self, mock_create, client_for):
+        """Test models without prompt caching get plain system content."""
+        mock_create.return_value = chat_response("Done", Usage(1, 1, 2))
+        client = client_for("openai/gpt-4o", temperature=0.2)
+
+        client.complete(
+            [
+                {"role": "system", "content": "Australian law only."},
+                {"role": "user", "content": "Summarise."},
+            ],
+            skip_citation_verification=True,
+        )
+
+        call_args = mock_create.call_args[1]["messages"]
+        assert call_args[0]["content"] == "Australian law only."
 
-    def test_command_context_tracking(self):
+    def test_command_context_tracking(self, client):
         """Test command context is properly tracked."""
-        self.client.command_context = "extractfacts"
-        assert self.client.command_context == "extractfacts"
+        client.command_context = "extractfacts"
+        assert client.command_context == "extractfacts"
 
 
 class TestCommandVerificationIntegration:
     """Test verification integration in commands."""
 
-    def test_extractfacts_command_sets_auto_verify(self):
+    def test_extractfacts_command_sets_auto_verify(self, client_for):
         """Test that extractfacts command forces verification to True."""
-        from litassist.llm import LLMClient
-
         # Create a client like extractfacts does
-        client = LLMClient("anthropic/claude-3-sonnet", temperature=0, top_p=0.15)
+        client = client_for("anthropic/claude-3-sonnet", temperature=0, top_p=0.15)
         client.command_context = "extractfacts"
 
         # extractfacts should always auto-verify regardless of input
         content = "Basic content without risk factors"
         assert client.should_auto_verify(content, "extractfacts") is True
 
-    def test_brainstorm_grok_client_auto_verifies(self):
+    @pytest.mark.xdist_group("grok")
+    @pytest.mark.parametrize("model", ["x-ai/grok-3", "x-ai/grok-3-beta"])
+    def test_brainstorm_grok_client_auto_verifies(self, model, client_for):
         """Test that Grok clients auto-verify in brainstorm."""
-        from litassist.llm import LLMClient
-
         # Create a Grok client like brainstorm does
-        grok_client = LLMClient("x-ai/grok-3", temperature=0.9, top_p=0.95)
+        grok_client = client_for(model, temperature=0.9, top_p=0.95)
         grok_client.command_context = "brainstorm"
 
         # Grok should auto-verify even basic content
         content = "Basic brainstorming content"
         assert grok_client.should_auto_verify(content, "brainstorm") is True
 
-    def test_strategy_command_sets_auto_verify(self):
+    def test_strategy_command_sets_auto_verify(self, client_for):
         """Test that strategy command forces verification to True."""
-        from litassist.llm import LLMClient
-
         # Create a client like strategy does
-        client = LLMClient("openai/gpt-4o", temperature=0.2, top_p=0.9)
+        client = client_for("openai/gpt-4o", temperature=0.2, top_p=0.9)
         client.command_context = "strategy"
 
         # strategy should always auto-verify regardless of input
@@ -7,32 +7,47 @@ generation/verification functionality.
 """
 
 import os
-import sys
+import threading
+import time
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 import pytest
 from click.testing import CliRunner
 
-# Mock pypdf to avoid import errors in test environment
-sys.modules["pypdf"] = Mock()
-
-from litassist.commands.verify import (  # noqa: E402
+from litassist.commands.verify import (
     verify,
     _format_citation_report,
     _parse_soundness_issues,
     _verify_reasoning_trace,
 )
-from litassist.utils import LegalReasoningTrace  # noqa: E402
+from litassist.utils import LegalReasoningTrace
 
 
 class TestVerifyCommand:
     """Test suite for verify command functionality."""
 
-    @pytest.fixture
+    @pytest.fixture(autouse=True)
+    def mocks(self):
+        """Patch citation lookup, the LLM factory and logging for every test."""
+        with patch(
+            "litassist.commands.verify.verify_all_citations"
+        ) as citations, patch(
+            "litassist.commands.verify.LLMClientFactory"
+        ) as llm, patch(
+            "litassist.commands.verify.save_log"
+        ) as save_log:
+            client = Mock()
+            llm.for_command.return_value = client
+            yield SimpleNamespace(
+                citations=citations, llm=llm, client=client, save_log=save_log
+            )
+
+    @pytest.fixture(scope="module")
     def runner(self):
         """Create a Click test runner."""
         return CliRunner()
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_legal_text(self):
         """Sample legal text for testing."""
         return """
@@ -47,7 +62,7 @@ class TestVerifyCommand:
         (Note: This is a fictional future case for testing)
         """
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_text_with_reasoning(self):
         """Sample legal text with existing reasoning trace."""
         return """
@@ -68,59 +83,138 @@ class TestVerifyCommand:
         path = tmp_path / "test_document.txt"
         return str(path)
 
-    def test_verify_all_checks_by_default(self, runner, temp_file, sample_legal_text):
+    def test_verify_all_checks_by_default(
+        self, mocks, runner, temp_file, sample_legal_text
+    ):
         """Test that verify runs all checks when no flags are provided."""
         with open(temp_file, "w") as f:
             f.write(sample_legal_text)
 
-        with patch(
-            "litassist.commands.verify.verify_all_citations"
-        ) as mock_citations, patch(
-            "litassist.commands.verify.LLMClientFactory"
-        ) as mock_llm_factory, patch(
-            "litassist.commands.verify.save_log"
-        ) as _mock_save_log:
-
-            mock_citations.return_value = (
-                [
-                    "Mabo v Queensland (No 2) [1992] HCA 23",
-                    "Donoghue v Stevenson [1932] AC 562",
-                ],
-                [("Smith v Jones [2025] NSWSC 999", "Future citation")],
-            )
-            mock_client = Mock()
-            mock_client.verify.return_value = "No legal issues found."
-            mock_client.complete.return_value = ("Analysis with reasoning trace", {})
-            mock_llm_factory.for_command.return_value = mock_client
+        mocks.citations.return_value = (
+            [
+                "Mabo v Queensland (No 2) [1992] HCA 23",
+                "Donoghue v Stevenson [1932] AC 562",
+            ],
+            [("Smith v Jones [2025] NSWSC 999", "Future citation")],
+        )
+        mocks.client.verify.return_value = "No legal issues found."
+        mocks.client.complete.return_value = ("Analysis with reasoning trace", {})
 
-            result = runner.invoke(verify, [temp_file])
-            assert result.exit_code == 0
-            assert "[VERIFYING]" in result.output
-            assert "Citation verification complete" in result.output
-            assert "2 citations verified, 1 unverified" in result.output
-            assert "Legal soundness check complete" in result.output
-            assert "0 issues identified" in result.output
-            assert "Reasoning trace generated" in result.output
-            assert "2 reports generated" in result.output  # Citations + Soundness (with embedded reasoning)
+        result = runner.invoke(verify, [temp_file])
+        assert result.exit_code == 0
+        assert "[VERIFYING]" in result.output
+        assert "Citation verification complete" in result.output
+        assert "2 citations verified, 1 unverified" in result.output
+        assert "Legal soundness check complete" in result.output
+        assert "0 issues identified" in result.output
+        assert "Reasoning trace generated" in result.output
+        assert "2 reports generated" in result.output  # Citations + Soundness (with embedded reasoning)
+        mocks.llm.for_command.assert_called_once_with("verify")
+
+    def test_verify_overlaps_citations_with_serial_llm_steps(
+        self, mocks, runner, temp_file, sample_legal_text
+    ):
+        """Test the citation lookup overlaps the LLM calls, which run one at a time."""
+        with open(temp_file, "w") as f:
+            f.write(sample_legal_text)
 
-    def test_verify_citations_only(self, runner, temp_file, sample_legal_text):
-        """Test citation verification only."""
+        llm_finished = threading.Event()
+        active = []
+        overlapped = []
+
+        def lookup(content):
+            # Only returns once the LLM steps have completed in parallel with it
+            assert llm_finished.wait(timeout=5)
+            return ["Mabo v Queensland (No 2) [1992] HCA 23"], []
+
+        def llm_call(result, last=False):
+            def call(*args, **kwargs):
+                overlapped.append(bool(active))
+                active.append(1)
+                time.sleep(0.01)
+                active.pop()
+                if last:
+                    llm_finished.set()
+                return result
+
+            return call
+
+        mocks.citations.side_effect = lookup
+        mocks.client.complete.side_effect = llm_call(("Analysis", {}))
+        mocks.client.verify.side_effect = llm_call("No legal issues found.", last=True)
+
+        result = runner.invoke(verify, [temp_file])
+
+        assert result.exit_code == 0
+        assert "failed" not in result.output
+        assert overlapped == [False, False]
+        assert "1 citations verified, 0 unverified" in result.output
+        assert "Reasoning trace generated" in result.output
+        assert "0 issues identified" in result.output
+
+    def test_verify_reasoning_extraction_error_is_reported(
+        self, mocks, runner, temp_file, sample_legal_text
+    ):
+        """Test a trace extraction failure is reported as a failed step."""
         with open(temp_file, "w") as f:
             f.write(sample_legal_text)
+        mocks.client.verify.return_value = "No legal issues found."
 
         with patch(
-            "litassist.commands.verify.verify_all_citations"
-        ) as mock_citations, patch(
-            "litassist.commands.verify.extract_citations"
-        ) as mock_extract, patch(
-            "litassist.commands.verify.save_log"
-        ) as _mock_save_log:
+            "litassist.commands.verify.extract_reasoning_trace",
+            side_effect=ValueError("bad trace"),
+        ):
+            result = runner.invoke(verify, [temp_file, "--reasoning", "--soundness"])
+
+        assert result.exit_code == 0
+        assert "Reasoning trace verification failed: bad trace" in result.output
+        assert "Legal soundness check complete" in result.output
+
+    def test_verify_client_error_is_reported_per_step(
+        self, mocks, runner, temp_file, sample_legal_text
+    ):
+        """Test an LLM client setup failure fails the LLM steps, not the command."""
+        with open(temp_file, "w") as f:
+            f.write(sample_legal_text)
+        mocks.citations.return_value = (["Mabo v Queensland (No 2) [1992] HCA 23"], [])
+        mocks.llm.for_command.side_effect = ValueError("no model configured")
+
+        result = runner.invoke(verify, [temp_file])
+
+        assert result.exit_code == 0
+        assert "Citation verification complete" in result.output
+        assert (
+            "Reasoning trace verification failed: no model configured" in result.output
+        )
+        assert "Legal soundness check failed: no model configured" in result.output
+
+    def test_verify_failed_llm_step_leaves_shared_client_usable(
+        self, mocks, runner, temp_file, sample_legal_text
+    ):
+        """Test a failing reasoning call does not stop soundness on the shared client."""
+        with open(temp_file, "w") as f:
+            f.write(sample_legal_text)
+        mocks.client.complete.side_effect = RuntimeError("model timeout")
+        mocks.client.verify.return_value = "No legal issues found."
 
+        result = runner.invoke(verify, [temp_file, "--reasoning", "--soundness"])
+
+        assert result.exit_code == 0
+        assert "Reasoning trace verification failed: model timeout" in result.output
+        assert "Legal soundness check complete" in result.output
+        mocks.llm.for_command.assert_called_once_with("verify")
+
+    def test_verify_citations_only(self, mocks, runner, temp_file, sample_legal_text):
+        """Test citation verification only."""
+        with open(temp_file, "w") as f:
+            f.write(sample_legal_text)
+
+        mocks.citations.return_value = (
+            ["Mabo v Queensland (No 2) [1992] HCA 23"],
+            [],
+        )
+        with patch("litassist.commands.verify.extract_citations") as mock_extract:
             mock_extract.return_value = ["Mabo v Queensland (No 2) [1992] HCA 23"]
-            mock_citations.return_value = (
-                ["Mabo v Queensland (No 2) [1992] HCA 23"],
-                [],
-            )
             result = runner.invoke(verify, [temp_file, "--citations"])
             assert result.exit_code == 0
             assert "Citation verification complete" in result.output
@@ -129,82 +223,85 @@ class TestVerifyCommand:
             assert "Reasoning trace" not in result.output
             assert "1 reports generated" in result.output
 
-    def test_verify_soundness_only(self, runner, temp_file, sample_legal_text):
-        """Test legal soundness verification only."""
+    def test_verify_no_cache_disables_persistent_cache(
+        self, mocks, runner, temp_file, sample_legal_text
+    ):
+        """Test --no-cache turns off the on-disk citation cache."""
         with open(temp_file, "w") as f:
             f.write(sample_legal_text)
 
+        mocks.citations.return_value = ([], [])
         with patch(
-            "litassist.commands.verify.LLMClientFactory"
-        ) as mock_llm_factory, patch(
-            "litassist.commands.verify.save_log"
-        ) as _mock_save_log:
+            "litassist.commands.verify.extract_citations", return_value=[]
+        ), patch(
+            "litassist.commands.verify.set_persistent_cache"
+        ) as mock_set_cache:
+            result = runner.invoke(verify, [temp_file, "--citations", "--no-cache"])
+
+        assert result.exit_code == 0
+        mock_set_cache.assert_called_once_with(False)
 
-            mock_client = Mock()
-            mock_client.verify.return_value = """
+    def test_verify_soundness_only(self, mocks, runner, temp_file, sample_legal_text):
+        """Test legal soundness verification only."""
+        with open(temp_file, "w") as f:
+            f.write(sample_legal_text)
+
+        mocks.client.verify.return_value = """
 ## Issues Found
 1. The document contains an error in citation format.
 """
-            mock_llm_factory.for_command.return_value = mock_client
 
-            result = runner.invoke(verify, [temp_file, "--soundness"])
-            assert result.exit_code == 0
-            assert "Legal soundness check complete" in result.output
-            assert "1 issues identified" in result.output
-            assert "Citation verification" not in result.output
-            assert "Reasoning trace" not in result.output
+        result = runner.invoke(verify, [temp_file, "--soundness"])
+        assert result.exit_code == 0
+        assert "Legal soundness check complete" in result.output
+        assert "1 issues identified" in result.output
+        assert "Citation verification" not in result.output
+        assert "Reasoning trace" not in result.output
 
     def test_verify_reasoning_existing_trace(
-        self, runner, temp_file, sample_text_with_reasoning
+        self, mocks, runner, temp_file, sample_text_with_reasoning
     ):
         """Test verification of existing reasoning trace."""
         with open(temp_file, "w") as f:
             f.write(sample_text_with_reasoning)
 
-        with patch(
-            "litassist.commands.verify.save_log"
-        ) as _mock_save_log:
-            result = runner.invoke(verify, [temp_file, "--reasoning"])
-            assert result.exit_code == 0
-            assert "Reasoning trace verified" in result.output
-            assert "IRAC structure complete" in result.output
-            assert "Confidence: 85%" in result.output
-            assert "Details: " in result.output  # File is now saved
-            assert "verify_test_document_reasoning.txt" in result.output
-
-    def test_verify_reasoning_generate_new(self, runner, temp_file, sample_legal_text):
+        result = runner.invoke(verify, [temp_file, "--reasoning"])
+        assert result.exit_code == 0
+        # The document's own trace is checked without building an LLM client
+        mocks.llm.for_command.assert_not_called()
+        assert "Reasoning trace verified" in result.output
+        assert "IRAC structure complete" in result.output
+        assert "Confidence: 85%" in result.output
+        assert "Details: " in result.output  # File is now saved
+        assert "verify_test_document_reasoning.txt" in result.output
+
+    def test_verify_reasoning_generate_new(
+        self, mocks, runner, temp_file, sample_legal_text
+    ):
         """Test generation of new reasoning trace."""
         with open(temp_file, "w") as f:
             f.write(sample_legal_text)
 
-        with patch(
-            "litassist.commands.verify.LLMClientFactory"
-        ) as mock_llm_factory, patch(
-            "litassist.commands.verify.save_log"
-        ) as _mock_save_log:
-
-            mock_client = Mock()
-            mock_client.complete.return_value = (
-                """Analysis of the legal text...
-                
-                === REASONING ===
-                Issue: Analysis of native title and negligence principles
-                Applicable Law: Mabo v Queensland, Donoghue v Stevenson
-                Application to Facts: The text discusses landmark cases
-                Conclusion: The principles remain fundamental to Australian law
-                Confidence: 90%
-                Sources: Mabo v Queensland (No 2) [1992] HCA 23; Donoghue v Stevenson [1932] AC 562
-                """,
-                {},
-            )
-            mock_llm_factory.for_command.return_value = mock_client
-            result = runner.invoke(verify, [temp_file, "--reasoning"])
-            assert result.exit_code == 0
-            assert "Reasoning trace generated" in result.output
-            assert "IRAC structure complete" in result.output
-            assert "Confidence: 90%" in result.output
-            assert "Details: " in result.output  # File is now saved
-            assert "verify_test_document_reasoning.txt" in result.output
+        mocks.client.complete.return_value = (
+            """Analysis of the legal text...
+            
+            === REASONING ===
+            Issue: Analysis of native title and negligence principles
+            Applicable Law: Mabo v Queensland, Donoghue v Stevenson
+            Application to Facts: The text discusses landmark cases
+            Conclusion: The principles remain fundamental to Australian law
+            Confidence: 90%
+            Sources: Mabo v Queensland (No 2) [1992] HCA 23; Donoghue v Stevenson [1932] AC 562
+            """,
+            {},
+        )
+        result = runner.invoke(verify, [temp_file, "--reasoning"])
+        assert result.exit_code == 0
+        assert "Reasoning trace generated" in result.output
+        assert "IRAC structure complete" in result.output
+        assert "Confidence: 90%" in result.output
+        assert "Details: " in result.output  # File is now saved
+        assert "verify_test_document_reasoning.txt" in result.output
 
     def test_verify_empty_file(self, runner, temp_file):
         """Test handling of empty file."""
@@ -219,6 +316,15 @@ class TestVerifyCommand:
         result = runner.invoke(verify, ["nonexistent.txt"])
         assert result.exit_code != 0
 
+    def test_verify_directory_rejected(self, runner, tmp_path):
+        """Test a directory argument fails at argument parsing."""
+        with patch("litassist.commands.verify.read_document") as mock_read:
+            result = runner.invoke(verify, [str(tmp_path)])
+
+        assert result.exit_code == 2
+        assert "is a directory" in result.output
+        mock_read.assert_not_called()
+
     def test_format_citation_report(self):
         """Test citation report formatting."""
         verified = ["Case1 [2020] HCA 1", "Case2 [2021] FCA 2"]
@@ -285,36 +391,43 @@ class TestVerifyCommand:
             "Invalid confidence score: 150" in issue for issue in status["issues"]
         )
 
-    def test_verify_with_api_failure(self, runner, temp_file, sample_legal_text):
+    def test_verify_reasoning_trace_without_sources_is_complete(self):
+        """Test confidence and source problems are reported without marking incomplete."""
+        trace = LegalReasoningTrace(
+            issue="Whether contract was breached",
+            applicable_law="Australian Contract Law and Consumer Protection Act",
+            application="The facts clearly show a breach of the delivery terms",
+            conclusion="Breach established, damages warranted",
+            confidence=-5,
+            sources=[],
+            command="verify",
+        )
+        status = _verify_reasoning_trace(trace)
+        assert status["complete"]
+        assert status["issues"] == [
+            "Invalid confidence score: -5",
+            "No legal sources cited",
+        ]
+
+    def test_verify_with_api_failure(self, mocks, runner, temp_file, sample_legal_text):
         """Test handling of API failures."""
         with open(temp_file, "w") as f:
             f.write(sample_legal_text)
-        with patch("litassist.commands.verify.verify_all_citations") as mock_citations:
-            mock_citations.side_effect = Exception("API unavailable")
-            result = runner.invoke(verify, [temp_file, "--citations"])
-            assert "Citation verification failed" in result.output
-            assert "API unavailable" in result.output
+        mocks.citations.side_effect = Exception("API unavailable")
+        result = runner.invoke(verify, [temp_file, "--citations"])
+        assert "Citation verification failed" in result.output
+        assert "API unavailable" in result.output
 
-    def test_output_files_created(self, runner, temp_file, sample_legal_text):
+    def test_output_files_created(self, mocks, runner, temp_file, sample_legal_text):
         """Test that output files are created with correct names."""
         with open(temp_file, "w") as f:
             f.write(sample_legal_text)
         base_name = os.path.splitext(temp_file)[0]
-        with patch(
-            "litassist.commands.verify.verify_all_citations"
-        ) as mock_citations, patch(
-            "litassist.commands.verify.LLMClientFactory"
-        ) as mock_llm_factory, patch(
-            "litassist.commands.verify.save_log"
-        ) as _mock_save_log:
-
-            mock_citations.return_value = (["Case1"], [])
-            mock_client = Mock()
-            mock_client.verify.return_value = "No issues"
-            mock_client.complete.return_value = ("Analysis", {})
-            mock_llm_factory.for_command.return_value = mock_client
-            result = runner.invoke(verify, [temp_file])
-            assert result.exit_code == 0
-            assert "_citations.txt" in result.output
-            assert "_soundness.txt" in result.output
-            # Reasoning trace is now embedded, not saved separately
+        mocks.citations.return_value = (["Case1"], [])
+        mocks.client.verify.return_value = "No issues"
+        mocks.client.complete.return_value = ("Analysis", {})
+        result = runner.invoke(verify, [temp_file])
+        assert result.exit_code == 0
+        assert "_citations.txt" in result.output
+        assert "_soundness.txt" in result.output
+        # Reasoning trace is now embedded, not saved separately